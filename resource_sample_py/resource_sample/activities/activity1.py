@@ -1,9 +1,8 @@
 # Copyright 2023 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-import os
-
 from common.messages import ComposeGreetingInput
+from common.settings import get_settings
 from temporalio import activity
 
 
@@ -11,7 +10,6 @@ from temporalio import activity
 @activity.defn(name="compose_greeting")
 async def compose_greeting(arg: ComposeGreetingInput) -> str:
     activity.logger.info("Running activity with parameter %s" % arg)
-    env_var = os.getenv("message")
-    juju_secret1 = os.getenv("juju-key1")
+    settings = get_settings()
 
-    return f"{env_var} {juju_secret1}"
+    return f"{settings.message} {settings.juju_key1}"
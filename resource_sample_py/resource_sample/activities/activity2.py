@@ -1,18 +1,27 @@
 # Copyright 2023 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-import os
-
 from common.messages import ComposeGreetingInput
+from common.settings import get_settings
+from common.vault import get_vault_reader
 from temporalio import activity
 
+VAULT_SECRETS_PATH = "vault-secrets"
+
 
 # Basic activity that logs and does string concatenation
 @activity.defn(name="vault_test")
 async def vault_test(arg: ComposeGreetingInput) -> str:
     activity.logger.info("Running activity with parameter %s" % arg)
 
-    sensitive1 = os.getenv("vault-key1")
-    sensitive2 = os.getenv("vault-key2")
+    settings = get_settings()
+
+    # Read the secrets from Vault at runtime when the charm is related to Vault, so
+    # that rotated secrets are picked up without restarting the worker.
+    vault = get_vault_reader(settings.vault)
+    if vault:
+        secret = await vault.read_secret(VAULT_SECRETS_PATH)
+        if "vault-secret1" in secret and "vault-secret2" in secret:
+            return f"{secret['vault-secret1']} {secret['vault-secret2']}"
 
-    return f"{sensitive1} {sensitive2}"
+    return f"{settings.vault_key1} {settings.vault_key2}"
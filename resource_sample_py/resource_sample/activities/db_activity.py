@@ -1,64 +1,45 @@
 # Copyright 2023 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-import os
-from typing import Optional
-
-import psycopg2
+from common.db import TEST_TABLE, get_pool, read_connection
 from common.messages import ComposeGreetingInput
-from psycopg2 import sql
-from psycopg2.extras import RealDictCursor
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from psycopg import sql
+from psycopg.rows import dict_row
 from temporalio import activity
 
 
-class DBConfig(BaseSettings):
-    host: Optional[str] = None
-    dbname: Optional[str] = Field(None, alias="TEMPORAL_DB_NAME")
-    user: Optional[str] = None
-    password: Optional[str] = None
-    port: Optional[str] = None
-
-    model_config = SettingsConfigDict(
-        env_prefix="TEMPORAL_DB_", case_sensitive=False, populate_by_name=True
-    )
-
-
 @activity.defn(name="database_test")
 async def database_test(arg: ComposeGreetingInput) -> str:
-    db_config = DBConfig()
-    table_name = "test_table"
-
-    with psycopg2.connect(**db_config.model_dump()) as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-
-            # Create test table
-            create_table_query = sql.SQL(
-                """
-                CREATE TABLE IF NOT EXISTS {table} (
-                    id SERIAL PRIMARY KEY,
-                    name VARCHAR(100) NOT NULL,
-                    value INTEGER NOT NULL
-                )
-            """
-            ).format(table=sql.Identifier(table_name))
-            cursor.execute(create_table_query)
-            conn.commit()
-
+    # Connections are borrowed from the process-wide pool, and the table is created
+    # once at worker startup by `common.db.setup_schema`.
+    async with get_pool().connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cursor:
             # Insert sample record
             insert_query = sql.SQL(
                 "INSERT INTO {table} (name, value) VALUES (%s, %s) RETURNING id"
-            ).format(table=sql.Identifier(table_name))
-            cursor.execute(insert_query, ("hello world", 123))
-            inserted_id = cursor.fetchone()["id"]
-            conn.commit()
+            ).format(table=sql.Identifier(TEST_TABLE))
+            await cursor.execute(insert_query, ("hello world", 123))
+            inserted_id = (await cursor.fetchone())["id"]
 
             # Read the record back
             select_query = sql.SQL("SELECT * FROM {table} WHERE id = %s").format(
-                table=sql.Identifier(table_name)
+                table=sql.Identifier(TEST_TABLE)
             )
-            cursor.execute(select_query, (inserted_id,))
-            record = cursor.fetchone()
+            await cursor.execute(select_query, (inserted_id,))
+            record = await cursor.fetchone()
 
     return record["name"]
+
+
+@activity.defn(name="database_read_test")
+async def database_read_test(arg: ComposeGreetingInput) -> int:
+    # Read-only queries are spread across the read-only replicas, if any.
+    async with read_connection() as conn:
+        async with conn.cursor() as cursor:
+            count_query = sql.SQL(
+                "SELECT COUNT(*) FROM {table} WHERE name = %s"
+            ).format(table=sql.Identifier(TEST_TABLE))
+            await cursor.execute(count_query, ("hello world",))
+            (count,) = await cursor.fetchone()
+
+    return count
@@ -0,0 +1,149 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BlobStore(ABC):
+    """Key-value store for offloaded payloads.
+
+    Methods are synchronous and run in the default executor by the async
+    wrappers, so that blocking I/O does not hold the event loop.
+    """
+
+    @abstractmethod
+    def put(self, key: str, data: bytes):
+        """Store `data` under `key`."""
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        """Return the blob stored under `key`."""
+
+    @abstractmethod
+    def delete_older_than(self, cutoff: float) -> int:
+        """Delete blobs last written before the `cutoff` timestamp."""
+
+    async def aput(self, key: str, data: bytes):
+        await self._run(self.put, key, data)
+
+    async def aget(self, key: str) -> bytes:
+        return await self._run(self.get, key)
+
+    async def adelete_older_than(self, cutoff: float) -> int:
+        return await self._run(self.delete_older_than, cutoff)
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(fn, *args))
+
+
+class FileSystemBlobStore(BlobStore):
+    """Store blobs as files under `path`, sharded by key prefix.
+
+    Also serves as a local stand-in for an object store in tests.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def _blob_path(self, key: str) -> Path:
+        return self.path / key[:2] / key
+
+    def put(self, key: str, data: bytes):
+        path = self._blob_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename it so that readers never see a
+        # partially written blob.
+        fd, tmp = tempfile.mkstemp(dir=path.parent)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def get(self, key: str) -> bytes:
+        return self._blob_path(key).read_bytes()
+
+    def delete_older_than(self, cutoff: float) -> int:
+        deleted = 0
+        for path in self.path.glob("*/*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    deleted += 1
+            except FileNotFoundError:
+                continue
+        return deleted
+
+
+class S3BlobStore(BlobStore):
+    """Store blobs as objects in an S3-compatible bucket."""
+
+    def __init__(self, bucket: str, endpoint: Optional[str] = None):
+        # boto3 is only needed when the S3 store is enabled.
+        import boto3
+
+        self.bucket = bucket
+        self._client = boto3.client("s3", endpoint_url=endpoint or None)
+
+    def put(self, key: str, data: bytes):
+        self._client.put_object(Bucket=self.bucket, Key=key, Body=data)
+
+    def get(self, key: str) -> bytes:
+        return self._client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def delete_older_than(self, cutoff: float) -> int:
+        deleted = 0
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket):
+            expired = [
+                {"Key": obj["Key"]}
+                for obj in page.get("Contents", [])
+                if obj["LastModified"].timestamp() < cutoff
+            ]
+            if expired:
+                # A listing page holds at most 1000 keys, the delete_objects limit.
+                self._client.delete_objects(
+                    Bucket=self.bucket, Delete={"Objects": expired, "Quiet": True}
+                )
+                deleted += len(expired)
+        return deleted
+
+
+class BlobGarbageCollector:
+    """Periodically delete blobs older than the retention period.
+
+    A blob's age is the time since it was offloaded: offloaded payloads are
+    encrypted with a random nonce, so the same payload offloaded again is stored
+    under a new key rather than rewriting the blob. A blob is referenced until
+    the history of its workflow is deleted, so the retention period has to be at
+    least the namespace retention period plus the maximum workflow run time.
+    """
+
+    def __init__(self, store: BlobStore, retention_days: int, interval: float = 3600):
+        self.store = store
+        self.retention = retention_days * 86400
+        self.interval = interval
+
+    async def run(self):
+        while True:
+            try:
+                cutoff = time.time() - self.retention
+                deleted = await self.store.adelete_older_than(cutoff)
+                if deleted:
+                    logger.info("Deleted %d expired payload blobs", deleted)
+            except Exception:
+                logger.exception("Failed to delete expired payload blobs")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,268 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import dataclasses
+import hashlib
+import time
+import zlib
+from typing import Iterable, List, Optional, Sequence
+
+from common.blobstore import BlobStore, FileSystemBlobStore, S3BlobStore
+from common.encryption import BatchedEncryptionPayloadCodec
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from temporalio.api.common.v1 import Payload
+from temporalio.common import MetricMeter
+from temporalio.converter import DataConverter, PayloadCodec
+from temporallib.encryption import EncryptionOptions
+
+COMPRESSION_RATIO_METRIC = "worker_payload_compression_ratio"
+COMPRESSION_RATIO_BUCKETS = [0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+CODEC_DURATION_METRIC = "worker_payload_codec_duration_seconds"
+CODEC_DURATION_BUCKETS = [
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+]
+
+
+class PayloadConfig(BaseSettings):
+    compression: str = "none"
+    compression_threshold: int = 1024
+
+    offload_store: str = "none"
+    offload_threshold: int = 262144
+    offload_retention_days: int = 30
+    offload_path: str = "/payloads"
+    offload_s3_bucket: Optional[str] = None
+    offload_s3_endpoint: Optional[str] = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="TEMPORAL_PAYLOAD_", case_sensitive=False, frozen=True
+    )
+
+
+class _Zlib:
+    encoding = b"binary/zlib"
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class _Zstd:
+    encoding = b"binary/zstd"
+
+    def __init__(self):
+        # zstandard is only needed when zstd compression is enabled.
+        import zstandard
+
+        self._compressor = zstandard.ZstdCompressor()
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._decompressor.decompress(data)
+
+
+ALGORITHMS = {"zlib": _Zlib, "zstd": _Zstd}
+DECODERS = {algorithm.encoding: algorithm for algorithm in ALGORITHMS.values()}
+
+
+class CompressionPayloadCodec(PayloadCodec):
+    """Compress payloads larger than `threshold` bytes.
+
+    The whole payload, including its metadata, is compressed and wrapped in a new
+    payload so that it can be restored as is. Payloads which are below the
+    threshold or do not shrink are passed through unchanged.
+
+    Payloads compressed with any supported algorithm are decoded, whatever
+    `algorithm` is, and payloads with an unknown encoding are passed through, so
+    that histories written before compression was changed or disabled can still
+    be replayed. The "none" algorithm only disables encoding.
+    """
+
+    def __init__(
+        self, algorithm: str, threshold: int, meter: Optional[MetricMeter] = None
+    ):
+        if algorithm != "none" and algorithm not in ALGORITHMS:
+            raise ValueError(f"Unsupported payload compression {algorithm!r}")
+
+        self.threshold = threshold
+        self._algorithm = ALGORITHMS[algorithm]() if algorithm != "none" else None
+        # Decoders of the other algorithms are created when first needed.
+        self._decoders = {}
+        if self._algorithm:
+            self._decoders[self._algorithm.encoding] = self._algorithm
+
+        self._ratio = None
+        self._duration = None
+        if meter:
+            self._ratio = meter.create_histogram_float(
+                COMPRESSION_RATIO_METRIC, "Compressed to original payload size"
+            )
+            self._duration = meter.create_histogram_float(
+                CODEC_DURATION_METRIC, "Time spent (de)compressing a payload", "s"
+            )
+
+    async def encode(self, payloads: Iterable[Payload]) -> List[Payload]:
+        if self._algorithm is None:
+            return list(payloads)
+
+        encoded = []
+        for payload in payloads:
+            data = payload.SerializeToString()
+            if len(data) < self.threshold:
+                encoded.append(payload)
+                continue
+
+            start = time.perf_counter()
+            compressed = self._algorithm.compress(data)
+            self._record(len(compressed) / len(data), start, "encode")
+
+            if len(compressed) >= len(data):
+                encoded.append(payload)
+                continue
+
+            encoded.append(
+                Payload(
+                    metadata={"encoding": self._algorithm.encoding}, data=compressed
+                )
+            )
+        return encoded
+
+    async def decode(self, payloads: Iterable[Payload]) -> List[Payload]:
+        decoded = []
+        for payload in payloads:
+            decoder = self._decoder(payload.metadata.get("encoding", b""))
+            if decoder is None:
+                decoded.append(payload)
+                continue
+
+            start = time.perf_counter()
+            original = Payload()
+            original.ParseFromString(decoder.decompress(payload.data))
+            self._record(None, start, "decode")
+            decoded.append(original)
+        return decoded
+
+    def _decoder(self, encoding: bytes):
+        if encoding not in self._decoders and encoding in DECODERS:
+            self._decoders[encoding] = DECODERS[encoding]()
+        return self._decoders.get(encoding)
+
+    def _record(self, ratio: Optional[float], start: float, operation: str):
+        if self._duration:
+            self._duration.record(time.perf_counter() - start, {"operation": operation})
+        if self._ratio and ratio is not None:
+            self._ratio.record(ratio)
+
+
+class ChainPayloadCodec(PayloadCodec):
+    """Apply codecs in order on encode and in reverse order on decode."""
+
+    def __init__(self, codecs: Sequence[PayloadCodec]):
+        self.codecs = list(codecs)
+
+    async def encode(self, payloads: Iterable[Payload]) -> List[Payload]:
+        result = list(payloads)
+        for codec in self.codecs:
+            result = await codec.encode(result)
+        return result
+
+    async def decode(self, payloads: Iterable[Payload]) -> List[Payload]:
+        result = list(payloads)
+        for codec in reversed(self.codecs):
+            result = await codec.decode(result)
+        return result
+
+
+class ClaimCheckPayloadCodec(PayloadCodec):
+    """Offload payloads larger than `threshold` bytes to a blob store.
+
+    Only a reference to the blob is kept in the workflow history. Blobs are keyed
+    by the SHA-256 of their content, so identical payloads are stored once unless
+    encryption, which uses a random nonce, is enabled.
+    """
+
+    ENCODING = b"binary/claim-check"
+
+    def __init__(self, store: BlobStore, threshold: int):
+        self.store = store
+        self.threshold = threshold
+
+    async def encode(self, payloads: Iterable[Payload]) -> List[Payload]:
+        return await asyncio.gather(*(self._encode(p) for p in payloads))
+
+    async def decode(self, payloads: Iterable[Payload]) -> List[Payload]:
+        return await asyncio.gather(*(self._decode(p) for p in payloads))
+
+    async def _encode(self, payload: Payload) -> Payload:
+        data = payload.SerializeToString()
+        if len(data) < self.threshold:
+            return payload
+
+        key = hashlib.sha256(data).hexdigest()
+        await self.store.aput(key, data)
+        return Payload(metadata={"encoding": self.ENCODING}, data=key.encode())
+
+    async def _decode(self, payload: Payload) -> Payload:
+        if payload.metadata.get("encoding") != self.ENCODING:
+            return payload
+
+        original = Payload()
+        original.ParseFromString(await self.store.aget(payload.data.decode()))
+        return original
+
+
+def create_blob_store(config: PayloadConfig) -> Optional[BlobStore]:
+    """Create the blob store for offloaded payloads, or None if disabled."""
+    if config.offload_store == "filesystem":
+        return FileSystemBlobStore(config.offload_path)
+    if config.offload_store == "s3":
+        if not config.offload_s3_bucket:
+            raise ValueError("S3 payload offload store requires a bucket")
+        return S3BlobStore(config.offload_s3_bucket, config.offload_s3_endpoint)
+    if config.offload_store != "none":
+        raise ValueError(f"Unsupported payload offload store {config.offload_store!r}")
+    return None
+
+
+def build_data_converter(
+    config: PayloadConfig,
+    store: Optional[BlobStore] = None,
+    meter: Optional[MetricMeter] = None,
+) -> DataConverter:
+    """Build a data converter chaining compression, encryption and offloading.
+
+    Compression has to run before encryption as encrypted data does not compress,
+    and offloading runs last so that blobs are stored encrypted. The compression
+    codec is kept when compression is disabled so that compressed payloads can
+    still be decoded.
+    """
+    encryption = EncryptionOptions()
+    codecs: List[PayloadCodec] = [
+        CompressionPayloadCodec(config.compression, config.compression_threshold, meter)
+    ]
+
+    if encryption.key:
+        codecs.append(BatchedEncryptionPayloadCodec(encryption.key))
+
+    if store is not None:
+        codecs.append(ClaimCheckPayloadCodec(store, config.offload_threshold))
+
+    return dataclasses.replace(
+        DataConverter.default, payload_codec=ChainPayloadCodec(codecs)
+    )
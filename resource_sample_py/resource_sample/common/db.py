@@ -0,0 +1,199 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import itertools
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator, Iterator, List, Optional
+
+from psycopg import AsyncConnection, sql
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+logger = logging.getLogger(__name__)
+
+TEST_TABLE = "test_table"
+# Seconds to wait for a replica connection before trying the next replica, so that
+# an unavailable replica delays read-only queries rather than failing them.
+REPLICA_TIMEOUT = 5.0
+
+
+class DBConfig(BaseSettings):
+    host: Optional[str] = None
+    dbname: Optional[str] = Field(None, alias="TEMPORAL_DB_NAME")
+    user: Optional[str] = None
+    password: Optional[str] = None
+    port: Optional[str] = None
+    tls: Optional[str] = None
+    # Comma-separated `host:port` list of every known endpoint, standbys being selected
+    # when connecting so that the list does not change on failover.
+    ro_hosts: Optional[str] = None
+    # Multi-host connection URI following the primary across failovers.
+    dsn: Optional[str] = None
+
+    # Connection pool settings, rendered by the charm from the `db-pool-*` options.
+    pool_size: int = 10
+    pool_idle_timeout: float = 300
+    pool_max_lifetime: float = 3600
+
+    model_config = SettingsConfigDict(
+        env_prefix="TEMPORAL_DB_",
+        case_sensitive=False,
+        populate_by_name=True,
+        frozen=True,
+    )
+
+    def conninfo(self, host: Optional[str] = None, port: Optional[str] = None) -> str:
+        return make_conninfo(
+            host=host or self.host,
+            port=port or self.port,
+            dbname=self.dbname,
+            user=self.user,
+            password=self.password,
+            sslmode="require" if (self.tls or "").lower() == "true" else "prefer",
+        )
+
+    def primary_conninfo(self) -> str:
+        if self.dsn:
+            return self.dsn
+        return self.conninfo()
+
+    def replica_conninfos(self) -> List[str]:
+        endpoints = [
+            endpoint.strip().partition(":")
+            for endpoint in (self.ro_hosts or "").split(",")
+            if endpoint.strip()
+        ]
+        conninfos = []
+        for index in range(len(endpoints)):
+            # Each pool tries the endpoints starting from a different one, and only accepts
+            # a standby, so that the pools spread over whichever hosts are standbys now.
+            rotated = endpoints[index:] + endpoints[:index]
+            conninfos.append(
+                make_conninfo(
+                    self.conninfo(
+                        host=",".join(host for host, _, _ in rotated),
+                        port=",".join(
+                            port or self.port or "5432" for _, _, port in rotated
+                        ),
+                    ),
+                    target_session_attrs="standby",
+                )
+            )
+        return conninfos
+
+
+def _create_pool(conninfo: str, config: DBConfig, name: str) -> AsyncConnectionPool:
+    return AsyncConnectionPool(
+        conninfo,
+        min_size=1,
+        max_size=config.pool_size,
+        max_idle=config.pool_idle_timeout,
+        max_lifetime=config.pool_max_lifetime,
+        # Discard connections broken by a failover before handing them out, so that
+        # the next connection attempt goes to the new primary.
+        check=AsyncConnectionPool.check_connection,
+        name=name,
+        open=False,
+    )
+
+
+_pool: Optional[AsyncConnectionPool] = None
+_replica_pools: List[AsyncConnectionPool] = []
+_replica_cycle: Optional[Iterator[AsyncConnectionPool]] = None
+
+
+async def open_pool(config: DBConfig) -> AsyncConnectionPool:
+    """Open the process-wide connection pools shared by all activities.
+
+    One pool is opened against the primary, and one per known endpoint for standbys.
+    """
+    global _pool, _replica_pools, _replica_cycle
+    if _pool is not None:
+        return _pool
+
+    pool = _create_pool(config.primary_conninfo(), config, "primary")
+    await pool.open(wait=True)
+    _pool = pool
+    logger.info(
+        "Opened database connection pool with up to %d connections", config.pool_size
+    )
+
+    # Replica pools connect in the background so that an unavailable replica does not
+    # prevent the worker from starting.
+    replica_pools = [
+        _create_pool(conninfo, config, f"replica-{index}")
+        for index, conninfo in enumerate(config.replica_conninfos())
+    ]
+    for replica_pool in replica_pools:
+        await replica_pool.open(wait=False)
+    _replica_pools = replica_pools
+    _replica_cycle = itertools.cycle(replica_pools) if replica_pools else None
+    if replica_pools:
+        logger.info("Opened %d read-only replica pools", len(replica_pools))
+
+    return _pool
+
+
+def get_pool() -> AsyncConnectionPool:
+    if _pool is None:
+        raise RuntimeError("Database connection pool is not open")
+    return _pool
+
+
+async def _replica_connection(stack: AsyncExitStack) -> Optional[AsyncConnection]:
+    """Borrow a connection from the next available replica, or None if none is."""
+    for _ in range(len(_replica_pools)):
+        replica_pool = next(_replica_cycle)
+        try:
+            return await stack.enter_async_context(
+                replica_pool.connection(timeout=REPLICA_TIMEOUT)
+            )
+        except PoolTimeout:
+            logger.warning("No connection available from %s", replica_pool.name)
+    return None
+
+
+@asynccontextmanager
+async def read_connection() -> AsyncIterator[AsyncConnection]:
+    """Borrow a connection for read-only queries, which may lag behind the primary.
+
+    Queries are spread across replicas in round-robin order. A replica which
+    cannot provide a connection within `REPLICA_TIMEOUT` is skipped, and queries
+    fall back to the primary when no replica is configured or available.
+    """
+    async with AsyncExitStack() as stack:
+        conn = await _replica_connection(stack)
+        if conn is None:
+            conn = await stack.enter_async_context(get_pool().connection())
+        yield conn
+
+
+async def close_pool():
+    global _pool, _replica_pools, _replica_cycle
+    for replica_pool in _replica_pools:
+        await replica_pool.close()
+    _replica_pools = []
+    _replica_cycle = None
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def setup_schema():
+    """Create the tables used by the activities, once at worker startup."""
+    async with get_pool().connection() as conn:
+        await conn.execute(
+            sql.SQL(
+                """
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id SERIAL PRIMARY KEY,
+                    name VARCHAR(100) NOT NULL,
+                    value INTEGER NOT NULL
+                )
+            """
+            ).format(table=sql.Identifier(TEST_TABLE))
+        )
@@ -0,0 +1,53 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import logging
+import os
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+ENVIRONMENT_FILE_VAR = "TEMPORAL_ENVIRONMENT_FILE"
+ENVIRONMENT_FILE_FORMAT_VAR = "TEMPORAL_ENVIRONMENT_FILE_FORMAT"
+
+
+def parse_dotenv(content: str) -> Dict[str, str]:
+    """Parse `KEY="value"` lines, as written by the charm.
+
+    Values are double-quoted with JSON escapes. Unquoted values are taken as is,
+    and blank lines and comments are skipped.
+    """
+    values = {}
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, _, value = line.partition("=")
+        values[key.strip()] = json.loads(value) if value.startswith('"') else value
+    return values
+
+
+def load_environment_file():
+    """Load the environment file delivered by the charm into `os.environ`.
+
+    The charm writes the variables from its `environment` config option to a
+    file instead of the process environment when `environment-delivery` is
+    `json` or `dotenv`. Variables already set in the process environment take
+    precedence, as they do when the charm sets both.
+    """
+    path = os.environ.get(ENVIRONMENT_FILE_VAR)
+    if not path:
+        return
+
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    if os.environ.get(ENVIRONMENT_FILE_FORMAT_VAR) == "dotenv":
+        values = parse_dotenv(content)
+    else:
+        values = json.loads(content)
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+    logger.info("Loaded %d variables from %s", len(values), path)
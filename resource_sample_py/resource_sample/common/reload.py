@@ -0,0 +1,66 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import logging
+import os
+
+from common.settings import reload_settings
+
+logger = logging.getLogger(__name__)
+
+RELOAD_FILE_VAR = "TEMPORAL_RELOAD_FILE"
+LOG_LEVEL_VAR = "TEMPORAL_LOG_LEVEL"
+
+# Variables set from the reload file, which a later reload may change. Other
+# variables of the process environment take precedence over the file.
+_reloaded = set()
+
+
+def load_reload_file() -> int:
+    """Load the reloadable variables written by the charm into `os.environ`.
+
+    The charm writes them to the file at `TEMPORAL_RELOAD_FILE` when its
+    `config-reload` option is `signal`, and sends `SIGHUP` when they change.
+    Variables set by a previous load and missing from the file are removed.
+    """
+    path = os.environ.get(RELOAD_FILE_VAR)
+    if not path:
+        return 0
+
+    with open(path, encoding="utf-8") as f:
+        values = json.load(f)
+
+    for key, value in values.items():
+        if key in _reloaded or key not in os.environ:
+            os.environ[key] = value
+            _reloaded.add(key)
+
+    # A variable removed from the file falls back to its default.
+    for key in _reloaded - values.keys():
+        os.environ.pop(key, None)
+        _reloaded.discard(key)
+    return len(values)
+
+
+def configure_logging():
+    """Set the level of the root logger from `TEMPORAL_LOG_LEVEL`."""
+    level = os.environ.get(LOG_LEVEL_VAR, "info").upper()
+    logging.basicConfig()
+    logging.getLogger().setLevel(level)
+
+
+def reload_config():
+    """Apply the reloadable configuration in place, on `SIGHUP`.
+
+    The previous configuration is kept if the new one cannot be loaded, so that
+    a bad update does not stop the worker.
+    """
+    try:
+        count = load_reload_file()
+        configure_logging()
+        reload_settings()
+    except Exception:
+        logger.exception("Failed to reload the configuration")
+        return
+    logger.info("Reloaded %d variables from %s", count, os.environ[RELOAD_FILE_VAR])
@@ -0,0 +1,88 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import logging
+import os
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+SECRETS_PATH_VAR = "TEMPORAL_SECRETS_PATH"
+MANIFEST = ".manifest.json"
+
+# Variables set from the secret files, removed again when their file is removed.
+_loaded = set()
+
+
+def load_secret_files(path: str) -> int:
+    """Load the secret files projected by the charm into `os.environ`.
+
+    Each file holds the value of the variable it is named after. Secret values
+    take precedence over the process environment, as they do when the charm
+    renders them as environment variables. Variables whose file was removed
+    since the previous load are removed from `os.environ`.
+    """
+    loaded = set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            with open(entry.path, encoding="utf-8") as f:
+                os.environ[entry.name] = f.read()
+            loaded.add(entry.name)
+
+    # A secret removed from the environment config must not outlive its file.
+    for name in _loaded - loaded:
+        os.environ.pop(name, None)
+    _loaded.clear()
+    _loaded.update(loaded)
+    return len(loaded)
+
+
+class SecretFilesWatcher:
+    """Reload the projected secrets when the charm rewrites them.
+
+    The charm writes the manifest after the secret files, and every write
+    replaces the file, so a new manifest inode or modification time means that a
+    complete update is in place. Polling the manifest costs a single `stat`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        on_change: Optional[Callable[[], object]] = None,
+        interval: float = 5.0,
+    ):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self._signature = self._stat()
+
+    def _stat(self):
+        try:
+            stat = os.stat(os.path.join(self.path, MANIFEST))
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """Reload the secrets if the manifest changed, returning whether it did."""
+        signature = self._stat()
+        if signature == self._signature:
+            return False
+
+        self._signature = signature
+        count = load_secret_files(self.path)
+        if self.on_change:
+            self.on_change()
+        logger.info("Reloaded %d secrets from %s", count, self.path)
+        return True
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Failed to reload secrets from %s", self.path)
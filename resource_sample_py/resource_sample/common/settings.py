@@ -0,0 +1,73 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+import threading
+from typing import Optional
+
+from common.codec import PayloadConfig
+from common.db import DBConfig
+from common.vault import VaultConfig
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerSettings(BaseSettings):
+    """Settings consumed by the activities.
+
+    The values are injected by the charm from the `environment` config option.
+    """
+
+    message: Optional[str] = None
+    juju_key1: Optional[str] = Field(None, alias="juju-key1")
+    vault_key1: Optional[str] = Field(None, alias="vault-key1")
+    vault_key2: Optional[str] = Field(None, alias="vault-key2")
+
+    db: DBConfig = Field(default_factory=DBConfig)
+    vault: VaultConfig = Field(default_factory=VaultConfig)
+    payload: PayloadConfig = Field(default_factory=PayloadConfig)
+
+    model_config = SettingsConfigDict(
+        case_sensitive=False, populate_by_name=True, extra="ignore", frozen=True
+    )
+
+
+_settings: Optional[WorkerSettings] = None
+_lock = threading.Lock()
+
+
+def load_settings() -> WorkerSettings:
+    """Load and validate the settings once, at worker startup.
+
+    Invalid settings raise a `pydantic.ValidationError` so that the worker fails
+    to start instead of failing on every activity.
+    """
+    global _settings
+    with _lock:
+        if _settings is None:
+            _settings = WorkerSettings()
+        return _settings
+
+
+def get_settings() -> WorkerSettings:
+    """Return the cached settings, loading them on first use."""
+    settings = _settings
+    if settings is None:
+        return load_settings()
+    return settings
+
+
+def reload_settings() -> WorkerSettings:
+    """Re-read the settings from the environment.
+
+    The previous settings are kept if the new ones are invalid, so that a bad
+    refresh does not break in-flight activities.
+    """
+    global _settings
+    settings = WorkerSettings()
+    with _lock:
+        _settings = settings
+    logger.info("Reloaded worker settings")
+    return settings
@@ -0,0 +1,148 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import hvac
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+logger = logging.getLogger(__name__)
+
+# Re-authenticate this many seconds before the Vault token expires.
+TOKEN_RENEWAL_MARGIN = 30
+
+
+class VaultConfig(BaseSettings):
+    addr: Optional[str] = None
+    # JSON file holding the AppRole `role_id` and `role_secret_id`, written by the
+    # charm so that the credentials are not exposed in the process environment.
+    approle_path: Optional[str] = None
+    mount: Optional[str] = None
+    cert_path: Optional[str] = None
+
+    # Seconds for which secrets without a Vault lease are cached.
+    cache_ttl: float = 300
+
+    model_config = SettingsConfigDict(
+        env_prefix="TEMPORAL_VAULT_", case_sensitive=False, frozen=True
+    )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.addr and self.approle_path and self.mount)
+
+
+@dataclass
+class _CacheEntry:
+    data: Dict[str, Any]
+    expires_at: float
+
+
+class VaultReader:
+    """Read Vault KV v2 secrets from activities with an in-memory cache.
+
+    Secrets are cached for the duration of their Vault lease, or `cache_ttl`
+    seconds for KV v2 secrets which are not leased, so that activities see rotated
+    secrets without a worker restart and without a Vault round trip per call.
+    Concurrent reads of the same path share a single request.
+    """
+
+    def __init__(self, config: VaultConfig):
+        self.config = config
+        self._client = hvac.Client(url=config.addr, verify=config.cert_path or True)
+        self._token_expires_at = 0.0
+        # Reads run in executor threads, which share the token.
+        self._token_lock = threading.Lock()
+        self._cache: Dict[str, _CacheEntry] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def read(self, path: str, key: str) -> Any:
+        """Read a single key of the secret at `path`."""
+        secret = await self.read_secret(path)
+        return secret[key]
+
+    async def read_secret(self, path: str) -> Dict[str, Any]:
+        """Read the secret at `path`, from the cache while it is fresh."""
+        entry = self._cache.get(path)
+        if entry and entry.expires_at > time.monotonic():
+            return entry.data
+
+        lock = self._locks.setdefault(path, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have refreshed the entry while we were waiting.
+            entry = self._cache.get(path)
+            if entry and entry.expires_at > time.monotonic():
+                return entry.data
+
+            response = await self._run(self._read_secret, path)
+            ttl = response.get("lease_duration") or self.config.cache_ttl
+            data = response["data"]["data"]
+            self._cache[path] = _CacheEntry(data, time.monotonic() + ttl)
+            return data
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop `path`, or every path, from the cache."""
+        if path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(path, None)
+
+    async def _run(self, fn, *args):
+        # hvac is synchronous, so calls are run in the default executor to keep the
+        # event loop free for other activities and workflow tasks.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(fn, *args))
+
+    def _read_secret(self, path: str) -> Dict[str, Any]:
+        self._ensure_token()
+        try:
+            return self._client.secrets.kv.v2.read_secret_version(
+                path=path, mount_point=self.config.mount, raise_on_deleted_version=True
+            )
+        except hvac.exceptions.Forbidden:
+            # The token may have been revoked before its expected expiry.
+            self._token_expires_at = 0.0
+            self._ensure_token()
+            return self._client.secrets.kv.v2.read_secret_version(
+                path=path, mount_point=self.config.mount, raise_on_deleted_version=True
+            )
+
+    def _ensure_token(self):
+        with self._token_lock:
+            if self._token_expires_at - TOKEN_RENEWAL_MARGIN > time.monotonic():
+                return
+
+            # The file is read on every login, so that rotated credentials are used
+            # without restarting the worker.
+            approle = json.loads(Path(self.config.approle_path).read_text())
+            response = self._client.auth.approle.login(
+                role_id=approle["role_id"],
+                secret_id=approle["role_secret_id"],
+                use_token=False,
+            )
+            self._client.token = response["auth"]["client_token"]
+            self._token_expires_at = (
+                time.monotonic() + response["auth"]["lease_duration"]
+            )
+            logger.debug("Authenticated to Vault")
+
+
+_reader: Optional[VaultReader] = None
+
+
+def get_vault_reader(config: VaultConfig) -> Optional[VaultReader]:
+    """Return the process-wide Vault reader, or None if Vault is not configured."""
+    global _reader
+    if not config.enabled:
+        return None
+    if _reader is None or _reader.config != config:
+        _reader = VaultReader(config)
+    return _reader
@@ -0,0 +1,5 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+
+"""Worker runtime monitoring."""
@@ -0,0 +1,108 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from temporalio.common import MetricMeter
+
+logger = logging.getLogger(__name__)
+
+LOOP_LAG_METRIC = "worker_event_loop_lag_seconds"
+LOOP_LAG_BUCKETS = [
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+]
+
+
+class LoopLagMonitor:
+    """Measure event loop lag and report the code blocking the loop.
+
+    A coroutine sleeping for `interval` seconds records how late it was woken up
+    into a histogram. A watchdog thread checks that the coroutine keeps ticking and,
+    when the loop has been held for longer than `threshold` seconds, logs the stack
+    of the event loop thread, pointing at the blocking call (e.g. synchronous I/O in
+    an `async def` activity).
+    """
+
+    def __init__(
+        self, meter: MetricMeter, interval: float = 0.25, threshold: float = 0.5
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self._lag = meter.create_histogram_float(
+            LOOP_LAG_METRIC, "Delay in scheduling event loop callbacks", "s"
+        )
+        self._blocked = meter.create_counter(
+            "worker_event_loop_blocked",
+            "Number of times the event loop was blocked past the threshold",
+        )
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_tick = time.monotonic()
+        self._stop = threading.Event()
+
+    async def run(self):
+        """Sample event loop lag until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+
+        watchdog = threading.Thread(
+            target=self._watch, name="loop-lag-watchdog", daemon=True
+        )
+        watchdog.start()
+        try:
+            while True:
+                expected = self._loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                self._lag.record(max(0.0, self._loop.time() - expected))
+                self._last_tick = time.monotonic()
+        finally:
+            self._stop.set()
+
+    def _watch(self):
+        reported_tick = None
+        while not self._stop.wait(self.threshold / 2):
+            last_tick = self._last_tick
+            held_for = time.monotonic() - last_tick - self.interval
+            if held_for < self.threshold or reported_tick == last_tick:
+                continue
+
+            # Only report each stall once, however long it lasts.
+            reported_tick = last_tick
+            self._blocked.add(1)
+            self._report(held_for)
+
+    def _report(self, held_for: float):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+
+        task = asyncio.current_task(self._loop)
+        task_name = task.get_name() if task else "<no task>"
+        coro = getattr(task.get_coro(), "__qualname__", "?") if task else "?"
+        logger.warning(
+            "Event loop blocked for more than %.3fs by task %s (%s):\n%s",
+            held_for,
+            task_name,
+            coro,
+            "".join(traceback.format_stack(frame)),
+        )
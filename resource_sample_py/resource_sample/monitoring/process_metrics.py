@@ -0,0 +1,129 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import gc
+import logging
+import os
+import resource
+import threading
+import time
+from typing import Dict, Optional
+
+from temporalio.common import MetricMeter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 15.0
+
+
+class ProcessMetrics:
+    """Periodically export process-level runtime metrics through a Temporal metric meter.
+
+    The metrics are exported on the same Prometheus endpoint as the Temporal SDK
+    metrics so that SDK latencies can be correlated with CPU, memory and GC activity.
+    """
+
+    def __init__(self, meter: MetricMeter, interval: float = DEFAULT_INTERVAL):
+        self.interval = interval
+        self._cpu_seconds = meter.create_gauge_float(
+            "worker_process_cpu_seconds", "Total user and system CPU time", "s"
+        )
+        self._resident_memory = meter.create_gauge(
+            "worker_process_resident_memory_bytes", "Resident set size", "By"
+        )
+        self._open_fds = meter.create_gauge(
+            "worker_process_open_fds", "Number of open file descriptors"
+        )
+        self._threads = meter.create_gauge(
+            "worker_process_threads", "Number of OS threads in the process"
+        )
+        self._gc_collections = meter.create_gauge(
+            "worker_python_gc_collections", "Garbage collections per generation"
+        )
+        self._gc_pause = meter.create_gauge_float(
+            "worker_python_gc_pause_seconds",
+            "Total time spent in garbage collection per generation",
+            "s",
+        )
+        self._asyncio_tasks = meter.create_gauge(
+            "worker_asyncio_tasks", "Number of pending asyncio tasks"
+        )
+
+        self._gc_pause_totals: Dict[int, float] = {}
+        self._gc_started_at: Optional[float] = None
+
+    def _on_gc(self, phase: str, info: dict):
+        if phase == "start":
+            self._gc_started_at = time.perf_counter()
+            return
+
+        if self._gc_started_at is None:
+            return
+
+        generation = info.get("generation", 0)
+        elapsed = time.perf_counter() - self._gc_started_at
+        self._gc_pause_totals[generation] = (
+            self._gc_pause_totals.get(generation, 0.0) + elapsed
+        )
+        self._gc_started_at = None
+
+    def sample(self):
+        """Record the current value of every process metric."""
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        self._cpu_seconds.set(usage.ru_utime + usage.ru_stime)
+        self._resident_memory.set(_resident_memory_bytes())
+        self._open_fds.set(_open_fds())
+        self._threads.set(_thread_count())
+
+        for generation, stats in enumerate(gc.get_stats()):
+            attributes = {"generation": str(generation)}
+            self._gc_collections.set(stats["collections"], attributes)
+            self._gc_pause.set(self._gc_pause_totals.get(generation, 0.0), attributes)
+
+        try:
+            self._asyncio_tasks.set(len(asyncio.all_tasks()))
+        except RuntimeError:
+            # No running event loop.
+            pass
+
+    async def run(self):
+        """Sample process metrics until cancelled."""
+        gc.callbacks.append(self._on_gc)
+        try:
+            while True:
+                try:
+                    self.sample()
+                except Exception as e:
+                    logger.warning("Failed to sample process metrics: %s", e)
+                await asyncio.sleep(self.interval)
+        finally:
+            gc.callbacks.remove(self._on_gc)
+
+
+def _resident_memory_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss is the peak RSS in kilobytes, which is the best we can do without procfs.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _open_fds() -> int:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return 0
+
+
+def _thread_count() -> int:
+    # Includes the threads started by the Temporal core SDK, which are not Python threads.
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("Threads:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return threading.active_count()
@@ -0,0 +1,33 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import os
+
+from common.codec import (
+    CODEC_DURATION_BUCKETS,
+    CODEC_DURATION_METRIC,
+    COMPRESSION_RATIO_BUCKETS,
+    COMPRESSION_RATIO_METRIC,
+)
+from monitoring.loop_lag import LOOP_LAG_BUCKETS, LOOP_LAG_METRIC
+from temporalio.runtime import PrometheusConfig, Runtime, TelemetryConfig
+
+
+def init_runtime() -> Runtime:
+    """Create the Temporal runtime exporting SDK and worker metrics on the Prometheus port."""
+    port = os.getenv("TEMPORAL_PROMETHEUS_PORT")
+    if not port:
+        return Runtime.default()
+
+    return Runtime(
+        telemetry=TelemetryConfig(
+            metrics=PrometheusConfig(
+                bind_address=f"0.0.0.0:{port}",
+                histogram_bucket_overrides={
+                    LOOP_LAG_METRIC: LOOP_LAG_BUCKETS,
+                    COMPRESSION_RATIO_METRIC: COMPRESSION_RATIO_BUCKETS,
+                    CODEC_DURATION_METRIC: CODEC_DURATION_BUCKETS,
+                },
+            )
+        )
+    )
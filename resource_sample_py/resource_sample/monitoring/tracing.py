@@ -0,0 +1,44 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import logging
+import os
+from typing import Optional
+
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from temporalio.contrib.opentelemetry import TracingInterceptor
+
+logger = logging.getLogger(__name__)
+
+
+def init_tracing() -> Optional[TracingInterceptor]:
+    """Export workflow and activity spans over OTLP if a tracing endpoint is set.
+
+    The endpoint and sampling ratio are rendered by the charm from the `tracing`
+    relation and the `tracing-sample-rate` config option.
+    """
+    endpoint = os.getenv("TEMPORAL_TRACING_ENDPOINT")
+    if not endpoint:
+        return None
+
+    sample_rate = float(os.getenv("TEMPORAL_TRACING_SAMPLE_RATE") or 1.0)
+    provider = TracerProvider(
+        resource=Resource.create(
+            {SERVICE_NAME: os.getenv("TEMPORAL_QUEUE") or "temporal-worker"}
+        ),
+        sampler=ParentBased(TraceIdRatioBased(sample_rate)),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            OTLPSpanExporter(endpoint=f"{endpoint.rstrip('/')}/v1/traces")
+        )
+    )
+    trace.set_tracer_provider(provider)
+
+    logger.info("Exporting traces to %s with sample rate %s", endpoint, sample_rate)
+    return TracingInterceptor()
@@ -7,12 +7,24 @@
 
 import asyncio
 import logging
+import os
+import signal
 
 from activities.activity1 import compose_greeting
 from activities.activity2 import vault_test
-from activities.db_activity import database_test
+from activities.db_activity import database_read_test, database_test
+from common.blobstore import BlobGarbageCollector
+from common.codec import build_data_converter, create_blob_store
+from common.db import close_pool, open_pool, setup_schema
+from common.environment import load_environment_file
+from common.reload import configure_logging, load_reload_file, reload_config
+from common.secret_files import SECRETS_PATH_VAR, SecretFilesWatcher, load_secret_files
+from common.settings import load_settings, reload_settings
+from monitoring.loop_lag import LoopLagMonitor
+from monitoring.process_metrics import ProcessMetrics
+from monitoring.runtime import init_runtime
+from monitoring.tracing import init_tracing
 from temporallib.client import Client, Options
-from temporallib.encryption import EncryptionOptions
 from temporallib.worker import SentryOptions, Worker, WorkerOptions
 from workflows.workflow1 import DatabaseWorkflow, GreetingWorkflow, VaultWorkflow
 
@@ -21,18 +33,64 @@ logger = logging.getLogger(__name__)
 
 async def run_worker():
     """Connect Temporal worker to Temporal server."""
+    # The environment file and secrets have to be loaded before anything reads
+    # the settings.
+    load_environment_file()
+    secrets_path = os.environ.get(SECRETS_PATH_VAR)
+    if secrets_path:
+        load_secret_files(secrets_path)
+    load_reload_file()
+    configure_logging()
+    # The charm signals reloadable configuration changes rather than restarting.
+    asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, reload_config)
+    # Fail fast on invalid configuration rather than on every activity.
+    settings = load_settings()
+
+    runtime = init_runtime()
+    # The tracing interceptor is picked up by workers created from this client.
+    tracing_interceptor = init_tracing()
+    # The data converter sets up encryption itself, so the client must not
+    # replace its payload codec.
+    blob_store = create_blob_store(settings.payload)
+    data_converter = build_data_converter(
+        settings.payload, blob_store, runtime.metric_meter
+    )
     client = await Client.connect(
-        client_opt=Options(encryption=EncryptionOptions()),
+        client_opt=Options(),
+        data_converter=data_converter,
+        interceptors=[tracing_interceptor] if tracing_interceptor else [],
+        runtime=runtime,
     )
 
     worker = Worker(
         client=client,
         workflows=[GreetingWorkflow, VaultWorkflow, DatabaseWorkflow],
-        activities=[compose_greeting, vault_test, database_test],
+        activities=[compose_greeting, vault_test, database_test, database_read_test],
         worker_opt=WorkerOptions(sentry=SentryOptions()),
     )
 
-    await worker.run()
+    # The database is only available when the charm is related to PostgreSQL.
+    if settings.db.host:
+        await open_pool(settings.db)
+        await setup_schema()
+
+    monitors = [
+        asyncio.create_task(ProcessMetrics(runtime.metric_meter).run()),
+        asyncio.create_task(LoopLagMonitor(runtime.metric_meter).run()),
+    ]
+    if secrets_path:
+        # Rotated secrets are picked up without restarting the worker.
+        watcher = SecretFilesWatcher(secrets_path, on_change=reload_settings)
+        monitors.append(asyncio.create_task(watcher.run()))
+    if blob_store and settings.payload.offload_retention_days:
+        gc = BlobGarbageCollector(blob_store, settings.payload.offload_retention_days)
+        monitors.append(asyncio.create_task(gc.run()))
+    try:
+        await worker.run()
+    finally:
+        for monitor in monitors:
+            monitor.cancel()
+        await close_pool()
 
 
 if __name__ == "__main__":  # pragma: nocover
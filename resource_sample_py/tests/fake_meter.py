@@ -0,0 +1,38 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Metric meter recording the values of the metrics it creates."""
+
+from collections import defaultdict
+
+
+class FakeMetric:
+    def __init__(self, name):
+        self.name = name
+        # Values recorded, keyed by the attributes they were recorded with.
+        self.values = defaultdict(list)
+
+    def _key(self, attributes):
+        return tuple(sorted((attributes or {}).items()))
+
+    def set(self, value, attributes=None):
+        self.values[self._key(attributes)].append(value)
+
+    add = record = set
+
+    def last(self, **attributes):
+        return self.values[self._key(attributes)][-1]
+
+    def total(self, **attributes):
+        return sum(self.values[self._key(attributes)])
+
+
+class FakeMeter:
+    def __init__(self):
+        self.metrics = {}
+
+    def _create(self, name, *args, **kwargs):
+        return self.metrics.setdefault(name, FakeMetric(name))
+
+    create_counter = create_gauge = create_gauge_float = _create
+    create_histogram = create_histogram_float = _create
@@ -0,0 +1,212 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Workflow histories of the sample workflows, for replay tests.
+
+Histories are built event by event in the shape the Temporal server records
+them, so that they can be replayed without a server. A history holds the
+commands issued by the workflow code it was recorded with, so replaying it
+against changed workflow code fails if the change is not deterministic.
+
+`signals` lengthens a history without changing what the workflow does: each
+signal arrives while the activity is running and adds a workflow task, as
+when a long-running workflow is signalled. `sleep` records a timer before the
+activity, as a version of the workflow which slept first would have.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from common.messages import ComposeGreetingInput
+from google.protobuf.duration_pb2 import Duration
+from google.protobuf.timestamp_pb2 import Timestamp
+from temporalio.api.common.v1 import ActivityType, Payloads, WorkflowType
+from temporalio.api.enums.v1 import EventType
+from temporalio.api.history.v1 import (
+    ActivityTaskCompletedEventAttributes,
+    ActivityTaskScheduledEventAttributes,
+    ActivityTaskStartedEventAttributes,
+    HistoryEvent,
+    TimerFiredEventAttributes,
+    TimerStartedEventAttributes,
+    WorkflowExecutionCompletedEventAttributes,
+    WorkflowExecutionSignaledEventAttributes,
+    WorkflowExecutionStartedEventAttributes,
+    WorkflowTaskCompletedEventAttributes,
+    WorkflowTaskScheduledEventAttributes,
+    WorkflowTaskStartedEventAttributes,
+)
+from temporalio.api.taskqueue.v1 import TaskQueue
+from temporalio.client import WorkflowHistory
+from temporalio.converter import DataConverter
+
+TASK_QUEUE = "test-queue"
+RESULT = "hello world"
+START_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# Workflow type, activity type and activity start-to-close timeout of the
+# sample workflows.
+WORKFLOWS = {
+    "GreetingWorkflow": ("compose_greeting", timedelta(seconds=10)),
+    "VaultWorkflow": ("vault_test", timedelta(seconds=10)),
+    "DatabaseWorkflow": ("database_test", timedelta(seconds=120)),
+}
+
+
+class _HistoryBuilder:
+    def __init__(self):
+        self.events = []
+
+    def add(self, event_type, attribute, attributes) -> int:
+        event_id = len(self.events) + 1
+        event_time = Timestamp()
+        event_time.FromDatetime(START_TIME + timedelta(milliseconds=event_id))
+        event = HistoryEvent(
+            event_id=event_id, event_time=event_time, event_type=event_type
+        )
+        getattr(event, attribute).CopyFrom(attributes)
+        self.events.append(event)
+        return event_id
+
+    def workflow_task(self) -> int:
+        scheduled = self.add(
+            EventType.EVENT_TYPE_WORKFLOW_TASK_SCHEDULED,
+            "workflow_task_scheduled_event_attributes",
+            WorkflowTaskScheduledEventAttributes(
+                task_queue=TaskQueue(name=TASK_QUEUE),
+                start_to_close_timeout=Duration(seconds=10),
+                attempt=1,
+            ),
+        )
+        started = self.add(
+            EventType.EVENT_TYPE_WORKFLOW_TASK_STARTED,
+            "workflow_task_started_event_attributes",
+            WorkflowTaskStartedEventAttributes(
+                scheduled_event_id=scheduled, identity="replay-test"
+            ),
+        )
+        return self.add(
+            EventType.EVENT_TYPE_WORKFLOW_TASK_COMPLETED,
+            "workflow_task_completed_event_attributes",
+            WorkflowTaskCompletedEventAttributes(
+                scheduled_event_id=scheduled,
+                started_event_id=started,
+                identity="replay-test",
+            ),
+        )
+
+
+def _payloads(*values) -> Payloads:
+    return Payloads(
+        payloads=DataConverter.default.payload_converter.to_payloads(values)
+    )
+
+
+def build_history(
+    workflow_type: str,
+    payload_size: int = 11,
+    signals: int = 0,
+    sleep: Optional[timedelta] = None,
+) -> WorkflowHistory:
+    """Build the history of a completed run of a sample workflow.
+
+    Args:
+        workflow_type: name of the sample workflow.
+        payload_size: size of the workflow argument, in bytes.
+        signals: number of signals received while the activity runs.
+        sleep: duration of a timer started before the activity, if any.
+
+    Returns:
+        the workflow history.
+    """
+    activity_type, timeout = WORKFLOWS[workflow_type]
+    name = "x" * payload_size
+    builder = _HistoryBuilder()
+
+    builder.add(
+        EventType.EVENT_TYPE_WORKFLOW_EXECUTION_STARTED,
+        "workflow_execution_started_event_attributes",
+        WorkflowExecutionStartedEventAttributes(
+            workflow_type=WorkflowType(name=workflow_type),
+            task_queue=TaskQueue(name=TASK_QUEUE),
+            input=_payloads(name),
+            workflow_run_timeout=Duration(seconds=20),
+            workflow_task_timeout=Duration(seconds=10),
+            original_execution_run_id="run-id",
+            first_execution_run_id="run-id",
+            attempt=1,
+        ),
+    )
+    completed = builder.workflow_task()
+
+    if sleep is not None:
+        timer = builder.add(
+            EventType.EVENT_TYPE_TIMER_STARTED,
+            "timer_started_event_attributes",
+            TimerStartedEventAttributes(
+                timer_id="1",
+                start_to_fire_timeout=Duration(seconds=int(sleep.total_seconds())),
+                workflow_task_completed_event_id=completed,
+            ),
+        )
+        builder.add(
+            EventType.EVENT_TYPE_TIMER_FIRED,
+            "timer_fired_event_attributes",
+            TimerFiredEventAttributes(timer_id="1", started_event_id=timer),
+        )
+        completed = builder.workflow_task()
+
+    scheduled = builder.add(
+        EventType.EVENT_TYPE_ACTIVITY_TASK_SCHEDULED,
+        "activity_task_scheduled_event_attributes",
+        ActivityTaskScheduledEventAttributes(
+            activity_id="1",
+            activity_type=ActivityType(name=activity_type),
+            task_queue=TaskQueue(name=TASK_QUEUE),
+            input=_payloads(ComposeGreetingInput("Hello", name)),
+            schedule_to_close_timeout=Duration(seconds=20),
+            schedule_to_start_timeout=Duration(seconds=20),
+            start_to_close_timeout=Duration(seconds=int(timeout.total_seconds())),
+            workflow_task_completed_event_id=completed,
+        ),
+    )
+
+    for index in range(signals):
+        builder.add(
+            EventType.EVENT_TYPE_WORKFLOW_EXECUTION_SIGNALED,
+            "workflow_execution_signaled_event_attributes",
+            WorkflowExecutionSignaledEventAttributes(
+                signal_name="progress", input=_payloads(index), identity="replay-test"
+            ),
+        )
+        builder.workflow_task()
+
+    started = builder.add(
+        EventType.EVENT_TYPE_ACTIVITY_TASK_STARTED,
+        "activity_task_started_event_attributes",
+        ActivityTaskStartedEventAttributes(
+            scheduled_event_id=scheduled, identity="replay-test", attempt=1
+        ),
+    )
+    builder.add(
+        EventType.EVENT_TYPE_ACTIVITY_TASK_COMPLETED,
+        "activity_task_completed_event_attributes",
+        ActivityTaskCompletedEventAttributes(
+            result=_payloads(RESULT),
+            scheduled_event_id=scheduled,
+            started_event_id=started,
+            identity="replay-test",
+        ),
+    )
+    completed = builder.workflow_task()
+    builder.add(
+        EventType.EVENT_TYPE_WORKFLOW_EXECUTION_COMPLETED,
+        "workflow_execution_completed_event_attributes",
+        WorkflowExecutionCompletedEventAttributes(
+            result=_payloads(RESULT), workflow_task_completed_event_id=completed
+        ),
+    )
+
+    return WorkflowHistory(
+        workflow_id=f"{workflow_type}-{payload_size}-{signals}", events=builder.events
+    )
@@ -0,0 +1,89 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import base64
+import os
+import time
+
+import pytest
+from common.blobstore import BlobGarbageCollector, BlobStore, FileSystemBlobStore
+from common.codec import ClaimCheckPayloadCodec, PayloadConfig, build_data_converter
+from temporalio.api.common.v1 import Payload
+
+KEY = base64.b64encode(b"0123456789abcdef0123456789abcdef").decode()
+
+
+def payloads(*sizes):
+    return [
+        Payload(metadata={"encoding": b"json/plain"}, data=os.urandom(size))
+        for size in sizes
+    ]
+
+
+def blobs(store):
+    return sorted(path for path in store.path.glob("*/*"))
+
+
+def test_store_is_abstract():
+    with pytest.raises(TypeError):
+        BlobStore()
+
+
+async def test_claim_check_round_trip(tmp_path):
+    store = FileSystemBlobStore(tmp_path)
+    codec = ClaimCheckPayloadCodec(store, threshold=1024)
+    original = payloads(10, 4096)
+
+    encoded = await codec.encode(original)
+
+    assert encoded[0] == original[0]
+    assert encoded[1].metadata["encoding"] == ClaimCheckPayloadCodec.ENCODING
+    assert len(blobs(store)) == 1
+    assert await codec.decode(encoded) == original
+
+
+async def test_blobs_are_stored_encrypted(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEMPORAL_ENCRYPTION_KEY", KEY)
+    store = FileSystemBlobStore(tmp_path)
+    converter = build_data_converter(
+        PayloadConfig(compression="zlib", offload_threshold=1024), store
+    )
+    original = payloads(4096)
+
+    encoded = await converter.payload_codec.encode(original)
+
+    assert encoded[0].metadata["encoding"] == ClaimCheckPayloadCodec.ENCODING
+    stored = Payload()
+    stored.ParseFromString(blobs(store)[0].read_bytes())
+    assert stored.metadata["encoding"] == b"binary/encrypted"
+    assert original[0].data not in stored.data
+    assert await converter.payload_codec.decode(encoded) == original
+
+
+def test_delete_older_than(tmp_path):
+    store = FileSystemBlobStore(tmp_path)
+    now = time.time()
+    store.put("aa-old", b"old")
+    store.put("bb-new", b"new")
+    os.utime(store._blob_path("aa-old"), (now - 7200, now - 7200))
+
+    assert store.delete_older_than(now - 3600) == 1
+
+    assert [path.name for path in blobs(store)] == ["bb-new"]
+    assert store.get("bb-new") == b"new"
+
+
+async def test_garbage_collector_deletes_expired_blobs(tmp_path):
+    store = FileSystemBlobStore(tmp_path)
+    now = time.time()
+    store.put("aa-old", b"old")
+    store.put("bb-new", b"new")
+    os.utime(store._blob_path("aa-old"), (now - 2 * 86400, now - 2 * 86400))
+
+    task = asyncio.create_task(BlobGarbageCollector(store, retention_days=1).run())
+    while len(blobs(store)) > 1:
+        await asyncio.sleep(0.01)
+    task.cancel()
+
+    assert [path.name for path in blobs(store)] == ["bb-new"]
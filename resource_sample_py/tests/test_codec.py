@@ -0,0 +1,43 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+from common.codec import CompressionPayloadCodec, PayloadConfig, build_data_converter
+from temporalio.api.common.v1 import Payload
+
+
+def payloads(*sizes):
+    return [
+        Payload(metadata={"encoding": b"json/plain"}, data=b"x" * size)
+        for size in sizes
+    ]
+
+
+@pytest.mark.parametrize("algorithm", ["none", "zlib", "zstd"])
+async def test_decodes_after_compression_change(algorithm):
+    original = payloads(10, 4096)
+    encoded = await CompressionPayloadCodec("zlib", threshold=1024).encode(original)
+    assert encoded[1].metadata["encoding"] == b"binary/zlib"
+
+    codec = CompressionPayloadCodec(algorithm, threshold=1024)
+
+    assert await codec.decode(encoded) == original
+
+
+async def test_none_does_not_compress():
+    original = payloads(4096)
+
+    assert (
+        await CompressionPayloadCodec("none", threshold=1024).encode(original)
+        == original
+    )
+
+
+async def test_converter_decodes_with_compression_disabled(monkeypatch):
+    monkeypatch.delenv("TEMPORAL_ENCRYPTION_KEY", raising=False)
+    original = payloads(4096)
+    encoded = await CompressionPayloadCodec("zlib", threshold=1024).encode(original)
+
+    converter = build_data_converter(PayloadConfig(compression="none"))
+
+    assert await converter.payload_codec.decode(encoded) == original
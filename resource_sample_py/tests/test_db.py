@@ -0,0 +1,73 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import itertools
+from contextlib import asynccontextmanager
+
+import pytest
+from common import db
+from psycopg.conninfo import conninfo_to_dict
+from psycopg_pool import PoolTimeout
+
+
+class FakePool:
+    def __init__(self, name, available=True):
+        self.name = name
+        self.available = available
+
+    @asynccontextmanager
+    async def connection(self, timeout=None):
+        if not self.available:
+            raise PoolTimeout(f"couldn't get a connection after {timeout} sec")
+        yield self.name
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    replicas = [FakePool("replica-0"), FakePool("replica-1")]
+    monkeypatch.setattr(db, "_pool", FakePool("primary"))
+    monkeypatch.setattr(db, "_replica_pools", replicas)
+    monkeypatch.setattr(db, "_replica_cycle", itertools.cycle(replicas))
+    return replicas
+
+
+async def read_from():
+    async with db.read_connection() as conn:
+        return conn
+
+
+async def test_reads_are_spread_across_replicas(pools):
+    assert [await read_from() for _ in range(3)] == [
+        "replica-0",
+        "replica-1",
+        "replica-0",
+    ]
+
+
+async def test_unavailable_replica_is_skipped(pools):
+    pools[0].available = False
+
+    assert [await read_from() for _ in range(2)] == ["replica-1", "replica-1"]
+
+
+async def test_reads_fall_back_to_primary(pools):
+    for replica in pools:
+        replica.available = False
+
+    assert await read_from() == "primary"
+
+
+def test_replica_pools_select_standbys():
+    config = db.DBConfig(ro_hosts="a:5432,b:5433,c", port="6543")
+
+    assert [conninfo_to_dict(conninfo) for conninfo in config.replica_conninfos()] == [
+        {
+            **conninfo_to_dict(config.conninfo(host=host, port=port)),
+            "target_session_attrs": "standby",
+        }
+        for host, port in [
+            ("a,b,c", "5432,5433,6543"),
+            ("b,c,a", "5433,6543,5432"),
+            ("c,a,b", "6543,5432,5433"),
+        ]
+    ]
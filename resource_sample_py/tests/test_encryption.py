@@ -0,0 +1,59 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import base64
+
+import pytest
+from common.encryption import BatchedEncryptionPayloadCodec
+from temporalio.api.common.v1 import Payload
+from temporallib.encryption import EncryptionPayloadCodec
+from temporallib.encryption.crypt import decrypt
+
+KEY = base64.b64encode(b"0123456789abcdef0123456789abcdef").decode()
+
+
+def payloads(*sizes):
+    return [
+        Payload(metadata={"encoding": b"json/plain"}, data=b"x" * size)
+        for size in sizes
+    ]
+
+
+@pytest.mark.parametrize("parallel_threshold", [1, 1024 * 1024])
+async def test_compatible_with_temporallib(parallel_threshold):
+    codec = BatchedEncryptionPayloadCodec(KEY, parallel_threshold=parallel_threshold)
+    reference = EncryptionPayloadCodec(KEY)
+    original = payloads(0, 100, 300 * 1024)
+
+    assert await reference.decode(await codec.encode(original)) == original
+    assert await codec.decode(await reference.encode(original)) == original
+
+
+async def test_passes_through_unencrypted_payloads():
+    codec = BatchedEncryptionPayloadCodec(KEY)
+    original = payloads(10)
+
+    assert await codec.decode(original) == original
+
+
+async def test_rejects_wrong_key():
+    encoded = await BatchedEncryptionPayloadCodec(KEY).encode(payloads(10))
+    other_key = base64.b64encode(b"f" * 32).decode()
+
+    with pytest.raises(ValueError, match="incorrect key or message corrupted"):
+        await BatchedEncryptionPayloadCodec(other_key).decode(encoded)
+
+
+@pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 64 * 1024 + 5])
+async def test_reuses_buffers_across_sizes(size):
+    codec = BatchedEncryptionPayloadCodec(KEY)
+    large = payloads(128 * 1024)
+    original = payloads(size)
+    await codec.decode(await codec.encode(large))
+
+    encoded = await codec.encode(original)
+
+    assert [decrypt(p.data, base64.b64decode(KEY)) for p in encoded] == [
+        p.SerializeToString() for p in original
+    ]
+    assert await codec.decode(encoded) == original
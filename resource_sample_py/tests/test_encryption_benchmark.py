@@ -0,0 +1,75 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Encryption codec microbenchmarks.
+
+Run with `poe benchmark`. Each payload size is encoded and decoded in batches
+by temporallib's codec and by the batched codec, reporting the throughput and
+the memory allocated per payload.
+"""
+
+import base64
+import gc
+import time
+import tracemalloc
+
+import pytest
+from common.encryption import BatchedEncryptionPayloadCodec
+from temporalio.api.common.v1 import Payload
+from temporallib.encryption import EncryptionPayloadCodec
+
+KEY = base64.b64encode(b"0123456789abcdef0123456789abcdef").decode()
+SIZES = [100, 1024, 10 * 1024, 100 * 1024, 1024 * 1024, 2 * 1024 * 1024]
+BATCH_SIZE = 8
+# Bytes processed per measurement, so that small payloads run enough iterations.
+TARGET_BYTES = 16 * 1024 * 1024
+MAX_ITERATIONS = 500
+
+CODECS = {
+    "temporallib": lambda: EncryptionPayloadCodec(KEY),
+    "batched": lambda: BatchedEncryptionPayloadCodec(KEY),
+}
+
+
+async def measure(codec, size):
+    batch = [Payload(metadata={"encoding": b"json/plain"}, data=b"x" * size)] * (
+        BATCH_SIZE
+    )
+    iterations = min(MAX_ITERATIONS, max(1, TARGET_BYTES // (size * BATCH_SIZE)))
+
+    # Warm up, so that buffers and caches are in place before measuring.
+    await codec.decode(await codec.encode(batch))
+
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await codec.decode(await codec.encode(batch))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    await codec.decode(await codec.encode(batch))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "throughput": iterations * BATCH_SIZE * size / elapsed / 1024 / 1024,
+        "peak_per_payload": peak / BATCH_SIZE,
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SIZES)
+async def test_encryption_codec(size):
+    results = {name: await measure(codec(), size) for name, codec in CODECS.items()}
+
+    for name, result in results.items():
+        print(
+            f"\n{name:>12} {size:>8} B: {result['throughput']:8.1f} MiB/s, "
+            f"{result['peak_per_payload'] / 1024:10.1f} KiB peak per payload"
+        )
+
+    # Throughput depends on the machine, but allocations must not regress.
+    assert (
+        results["batched"]["peak_per_payload"]
+        <= results["temporallib"]["peak_per_payload"]
+    )
@@ -0,0 +1,57 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import os
+
+import pytest
+from common.environment import load_environment_file, parse_dotenv
+
+VALUES = {"hello": "world", "nested": json.dumps({"a": [1, 2]}), "quote": 'say "hi"'}
+
+
+@pytest.fixture
+def environment_file(tmp_path, monkeypatch):
+    def write(file_format, content):
+        path = tmp_path / "environment"
+        path.write_text(content)
+        monkeypatch.setenv("TEMPORAL_ENVIRONMENT_FILE", str(path))
+        monkeypatch.setenv("TEMPORAL_ENVIRONMENT_FILE_FORMAT", file_format)
+
+    yield write
+    # The loader sets variables in the process environment directly.
+    for key in VALUES:
+        os.environ.pop(key, None)
+
+
+def test_load_json(environment_file):
+    environment_file("json", json.dumps(VALUES))
+
+    load_environment_file()
+
+    assert {key: os.environ[key] for key in VALUES} == VALUES
+
+
+def test_load_dotenv(environment_file):
+    content = "".join(f"{key}={json.dumps(value)}\n" for key, value in VALUES.items())
+    environment_file("dotenv", content)
+
+    load_environment_file()
+
+    assert {key: os.environ[key] for key in VALUES} == VALUES
+
+
+def test_process_environment_takes_precedence(environment_file, monkeypatch):
+    monkeypatch.setenv("hello", "pebble")
+    environment_file("json", json.dumps(VALUES))
+
+    load_environment_file()
+
+    assert os.environ["hello"] == "pebble"
+
+
+def test_parse_dotenv_skips_comments_and_blank_lines():
+    assert parse_dotenv('# comment\n\nplain=value\nquoted="a=b"\n') == {
+        "plain": "value",
+        "quoted": "a=b",
+    }
@@ -0,0 +1,48 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import logging
+import time
+
+import pytest
+from monitoring.loop_lag import LOOP_LAG_METRIC, LoopLagMonitor
+
+from tests.fake_meter import FakeMeter
+
+
+def block_the_loop():
+    time.sleep(0.3)
+
+
+async def test_blocking_call_is_reported(caplog):
+    meter = FakeMeter()
+    monitor = LoopLagMonitor(meter, interval=0.02, threshold=0.1)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+
+    with caplog.at_level(logging.WARNING, logger="monitoring.loop_lag"):
+        block_the_loop()
+        await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert meter.metrics["worker_event_loop_blocked"].total() == 1
+    assert max(meter.metrics[LOOP_LAG_METRIC].values[()]) >= 0.2
+    [record] = caplog.records
+    assert "Event loop blocked" in record.getMessage()
+    assert "block_the_loop" in record.getMessage()
+
+
+async def test_idle_loop_is_not_reported():
+    meter = FakeMeter()
+    monitor = LoopLagMonitor(meter, interval=0.02, threshold=0.1)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not meter.metrics["worker_event_loop_blocked"].values
+    assert meter.metrics[LOOP_LAG_METRIC].values[()]
@@ -0,0 +1,70 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import gc
+import os
+import threading
+
+import pytest
+from monitoring.process_metrics import ProcessMetrics
+
+from tests.fake_meter import FakeMeter
+
+
+def test_sample():
+    meter = FakeMeter()
+    metrics = ProcessMetrics(meter)
+    release = threading.Event()
+    thread = threading.Thread(target=release.wait)
+    thread.start()
+    try:
+        metrics.sample()
+    finally:
+        release.set()
+        thread.join()
+
+    assert meter.metrics["worker_process_cpu_seconds"].last() > 0
+    assert meter.metrics["worker_process_resident_memory_bytes"].last() > 0
+    assert meter.metrics["worker_process_open_fds"].last() >= 3
+    assert meter.metrics["worker_process_threads"].last() >= 2
+    for generation, stats in enumerate(gc.get_stats()):
+        assert (
+            meter.metrics["worker_python_gc_collections"].last(
+                generation=str(generation)
+            )
+            == stats["collections"]
+        )
+    # Without a running event loop, no task count is recorded.
+    assert not meter.metrics["worker_asyncio_tasks"].values
+
+
+def test_open_fds_follow_the_process():
+    meter = FakeMeter()
+    metrics = ProcessMetrics(meter)
+    metrics.sample()
+    fds = [os.open(os.devnull, os.O_RDONLY) for _ in range(5)]
+    try:
+        metrics.sample()
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+    values = meter.metrics["worker_process_open_fds"].values[()]
+    assert values[1] - values[0] == 5
+
+
+async def test_gc_pauses_and_tasks_are_recorded():
+    meter = FakeMeter()
+    metrics = ProcessMetrics(meter, interval=0.01)
+    task = asyncio.create_task(metrics.run())
+    await asyncio.sleep(0)
+    gc.collect()
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert meter.metrics["worker_python_gc_pause_seconds"].last(generation="2") > 0
+    assert meter.metrics["worker_asyncio_tasks"].last() >= 2
+    assert metrics._on_gc not in gc.callbacks
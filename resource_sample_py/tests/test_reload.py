@@ -0,0 +1,73 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import json
+import logging
+import os
+
+import pytest
+from common import reload
+from common.reload import (
+    LOG_LEVEL_VAR,
+    RELOAD_FILE_VAR,
+    load_reload_file,
+    reload_config,
+)
+from common.settings import get_settings, reload_settings
+
+
+@pytest.fixture
+def reload_file(tmp_path):
+    path = tmp_path / "reload.json"
+    os.environ[RELOAD_FILE_VAR] = str(path)
+    level = logging.getLogger().level
+    yield path
+    for key in (RELOAD_FILE_VAR, LOG_LEVEL_VAR, "message", *reload._reloaded):
+        os.environ.pop(key, None)
+    reload._reloaded.clear()
+    logging.getLogger().setLevel(level)
+    reload_settings()
+
+
+def test_reload_config(reload_file):
+    reload_file.write_text(json.dumps({LOG_LEVEL_VAR: "info", "message": "hello"}))
+    reload_config()
+
+    assert get_settings().message == "hello"
+    assert logging.getLogger().level == logging.INFO
+
+    reload_file.write_text(json.dumps({LOG_LEVEL_VAR: "debug", "message": "hi"}))
+    reload_config()
+
+    assert get_settings().message == "hi"
+    assert logging.getLogger().level == logging.DEBUG
+
+
+def test_reload_config_keeps_invalid_update(reload_file):
+    reload_file.write_text(json.dumps({"message": "hello"}))
+    reload_config()
+
+    reload_file.write_text("{")
+    reload_config()
+
+    assert get_settings().message == "hello"
+
+
+def test_process_environment_takes_precedence(reload_file):
+    os.environ["message"] = "from the plan"
+    reload_file.write_text(json.dumps({"message": "hello"}))
+
+    assert load_reload_file() == 1
+    assert os.environ["message"] == "from the plan"
+
+
+def test_removed_variable_is_unset(reload_file):
+    reload_file.write_text(json.dumps({"message": "hello", "extra": "value"}))
+    load_reload_file()
+
+    reload_file.write_text(json.dumps({"message": "hi"}))
+
+    assert load_reload_file() == 1
+    assert os.environ["message"] == "hi"
+    assert "extra" not in os.environ
+    assert reload._reloaded == {"message"}
@@ -0,0 +1,34 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+from datetime import timedelta
+
+import pytest
+from temporalio.worker import Replayer
+from temporalio.workflow import NondeterminismError
+from workflows.workflow1 import DatabaseWorkflow, GreetingWorkflow, VaultWorkflow
+
+from tests.histories import WORKFLOWS, build_history
+
+
+@pytest.fixture
+def replayer():
+    return Replayer(workflows=[GreetingWorkflow, VaultWorkflow, DatabaseWorkflow])
+
+
+@pytest.mark.parametrize("signals", [0, 100])
+@pytest.mark.parametrize("workflow_type", WORKFLOWS)
+async def test_replay_is_deterministic(replayer, workflow_type, signals):
+    history = build_history(workflow_type, signals=signals)
+
+    result = await replayer.replay_workflow(history)
+
+    assert result.replay_failure is None
+
+
+async def test_replay_detects_nondeterminism(replayer):
+    # Recorded by a version of the workflow which slept before the activity.
+    history = build_history("GreetingWorkflow", sleep=timedelta(seconds=1))
+
+    with pytest.raises(NondeterminismError):
+        await replayer.replay_workflow(history)
@@ -0,0 +1,100 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Workflow replay benchmarks.
+
+Run with `poe benchmark`. Histories of each sample workflow, of increasing
+length and payload size, are replayed with the SDK `Replayer`, reporting the
+replay time per history event and the peak memory allocated by Python. A case
+fails if it replays non-deterministically, or if either measurement exceeds
+`replay_baseline.json` by more than `REPLAY_TOLERANCE` (default 1.0, i.e. twice
+the baseline). Set `REPLAY_UPDATE_BASELINE=1` to record the results as the new
+baseline.
+"""
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from temporalio.worker import Replayer
+from workflows.workflow1 import DatabaseWorkflow, GreetingWorkflow, VaultWorkflow
+
+from tests.histories import WORKFLOWS, build_history
+
+SIGNALS = [0, 100, 1000]
+PAYLOAD_SIZES = [100, 256 * 1024]
+ROUNDS = 3
+
+BASELINE_PATH = Path(__file__).parent / "replay_baseline.json"
+TOLERANCE = float(os.environ.get("REPLAY_TOLERANCE", "1.0"))
+UPDATE_BASELINE = os.environ.get("REPLAY_UPDATE_BASELINE") == "1"
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    results = {}
+    yield baseline, results
+
+    if UPDATE_BASELINE:
+        # Cases which were not run keep their previous baseline.
+        merged = {**baseline, **results}
+        BASELINE_PATH.write_text(
+            json.dumps(dict(sorted(merged.items())), indent=2) + "\n"
+        )
+
+
+async def measure(replayer, history):
+    # Warm up, so that the workflow modules are loaded in the sandbox.
+    await replayer.replay_workflow(history)
+
+    gc.collect()
+    elapsed = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await replayer.replay_workflow(history)
+        elapsed.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    await replayer.replay_workflow(history)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "events": len(history.events),
+        "seconds_per_event": min(elapsed) / len(history.events),
+        "peak_memory": peak,
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("payload_size", PAYLOAD_SIZES)
+@pytest.mark.parametrize("signals", SIGNALS)
+@pytest.mark.parametrize("workflow_type", WORKFLOWS)
+async def test_replay(baseline, workflow_type, signals, payload_size):
+    baseline, results = baseline
+    replayer = Replayer(workflows=[GreetingWorkflow, VaultWorkflow, DatabaseWorkflow])
+    history = build_history(workflow_type, payload_size=payload_size, signals=signals)
+    case = f"{workflow_type}-{signals}-{payload_size}"
+
+    result = await measure(replayer, history)
+    results[case] = result
+    print(
+        f"\n{case:>32}: {result['events']:>5} events, "
+        f"{result['seconds_per_event'] * 1e6:8.1f} us per event, "
+        f"{result['peak_memory'] / 1024:10.1f} KiB peak"
+    )
+
+    expected = baseline.get(case)
+    if UPDATE_BASELINE or not expected:
+        return
+    regressions = [
+        f"{metric}: {result[metric]:.6g} > {expected[metric]:.6g}"
+        for metric in ("seconds_per_event", "peak_memory")
+        if result[metric] > expected[metric] * (1 + TOLERANCE)
+    ]
+    assert not regressions, f"{case} regressed ({', '.join(regressions)})"
@@ -0,0 +1,61 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import os
+from unittest import mock
+
+import pytest
+from common import secret_files
+from common.secret_files import MANIFEST, SecretFilesWatcher, load_secret_files
+
+
+@pytest.fixture
+def secrets_path(tmp_path):
+    yield tmp_path
+    # The loader sets variables in the process environment directly.
+    for name in ("sensitive1", "sensitive2", *secret_files._loaded):
+        os.environ.pop(name, None)
+    secret_files._loaded.clear()
+
+
+def project(path, values):
+    # Replace the files, as Pebble does, and write the manifest last.
+    for name, value in values.items():
+        (path / f"{name}.tmp").write_text(value)
+        os.replace(path / f"{name}.tmp", path / name)
+    (path / "manifest.tmp").write_text(repr(sorted(values.items())))
+    os.replace(path / "manifest.tmp", path / MANIFEST)
+
+
+def test_load_secret_files(secrets_path):
+    project(secrets_path, {"sensitive1": "hello"})
+
+    assert load_secret_files(str(secrets_path)) == 1
+    assert os.environ["sensitive1"] == "hello"
+
+
+def test_removed_secret_file_is_unset(secrets_path):
+    project(secrets_path, {"sensitive1": "hello", "sensitive2": "world"})
+    load_secret_files(str(secrets_path))
+
+    os.unlink(secrets_path / "sensitive2")
+    project(secrets_path, {"sensitive1": "hello"})
+
+    assert load_secret_files(str(secrets_path)) == 1
+    assert os.environ["sensitive1"] == "hello"
+    assert "sensitive2" not in os.environ
+
+
+def test_watcher_reloads_on_manifest_change(secrets_path):
+    project(secrets_path, {"sensitive1": "hello"})
+    on_change = mock.Mock()
+    watcher = SecretFilesWatcher(str(secrets_path), on_change=on_change)
+
+    assert not watcher.check()
+    on_change.assert_not_called()
+
+    project(secrets_path, {"sensitive1": "rotated"})
+
+    assert watcher.check()
+    on_change.assert_called_once_with()
+    assert os.environ["sensitive1"] == "rotated"
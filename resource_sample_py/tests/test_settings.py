@@ -0,0 +1,56 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+from common import settings
+from common.settings import get_settings, load_settings, reload_settings
+from pydantic import ValidationError
+
+
+@pytest.fixture(autouse=True)
+def clean_settings(monkeypatch):
+    monkeypatch.setattr(settings, "_settings", None)
+    monkeypatch.delenv("message", raising=False)
+    monkeypatch.delenv("TEMPORAL_DB_POOL_SIZE", raising=False)
+
+
+def test_settings_are_loaded_once(monkeypatch):
+    monkeypatch.setenv("message", "hello")
+    monkeypatch.setenv("TEMPORAL_DB_POOL_SIZE", "20")
+
+    loaded = load_settings()
+    monkeypatch.setenv("message", "changed")
+
+    assert loaded.message == "hello"
+    assert loaded.db.pool_size == 20
+    assert load_settings() is loaded
+    assert get_settings() is loaded
+
+
+def test_invalid_settings_fail_loading(monkeypatch):
+    monkeypatch.setenv("TEMPORAL_DB_POOL_SIZE", "many")
+
+    with pytest.raises(ValidationError):
+        load_settings()
+
+
+def test_reload_settings(monkeypatch):
+    monkeypatch.setenv("message", "hello")
+    load_settings()
+
+    monkeypatch.setenv("message", "hi")
+
+    assert reload_settings().message == "hi"
+    assert get_settings().message == "hi"
+
+
+def test_invalid_reload_keeps_previous_settings(monkeypatch):
+    monkeypatch.setenv("message", "hello")
+    previous = load_settings()
+
+    monkeypatch.setenv("message", "hi")
+    monkeypatch.setenv("TEMPORAL_DB_POOL_SIZE", "many")
+
+    with pytest.raises(ValidationError):
+        reload_settings()
+    assert get_settings() is previous
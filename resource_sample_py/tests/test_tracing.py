@@ -0,0 +1,94 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from monitoring.tracing import init_tracing
+from opentelemetry import trace
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
+    ExportTraceServiceRequest,
+)
+from opentelemetry.util._once import Once
+from temporalio.contrib.opentelemetry import TracingInterceptor
+
+
+@pytest.fixture
+def otlp_sink():
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            request = ExportTraceServiceRequest()
+            request.ParseFromString(body)
+            requests.append((self.path, request))
+            self.send_response(200)
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", requests
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def tracing_env(monkeypatch, otlp_sink):
+    endpoint, _ = otlp_sink
+    monkeypatch.setenv("TEMPORAL_TRACING_ENDPOINT", endpoint)
+    monkeypatch.setenv("TEMPORAL_QUEUE", "test-queue")
+    # The global tracer provider can only be set once per process.
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER_SET_ONCE", Once())
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", None)
+    yield
+    trace.get_tracer_provider().shutdown()
+
+
+def export_spans(count):
+    tracer = trace.get_tracer(__name__)
+    for index in range(count):
+        with tracer.start_as_current_span(f"span-{index}"):
+            pass
+    trace.get_tracer_provider().force_flush()
+
+
+def test_tracing_is_disabled_without_endpoint(monkeypatch):
+    monkeypatch.delenv("TEMPORAL_TRACING_ENDPOINT", raising=False)
+
+    assert init_tracing() is None
+
+
+def test_spans_are_exported(tracing_env, otlp_sink):
+    _, requests = otlp_sink
+
+    assert isinstance(init_tracing(), TracingInterceptor)
+    export_spans(3)
+
+    [(path, request)] = requests
+    assert path == "/v1/traces"
+    [resource_spans] = request.resource_spans
+    attributes = {
+        attribute.key: attribute.value.string_value
+        for attribute in resource_spans.resource.attributes
+    }
+    assert attributes["service.name"] == "test-queue"
+    spans = [span for scope in resource_spans.scope_spans for span in scope.spans]
+    assert [span.name for span in spans] == ["span-0", "span-1", "span-2"]
+
+
+def test_configured_sampler(tracing_env, otlp_sink, monkeypatch):
+    _, requests = otlp_sink
+    monkeypatch.setenv("TEMPORAL_TRACING_SAMPLE_RATE", "0")
+
+    init_tracing()
+    export_spans(10)
+
+    sampler = trace.get_tracer_provider().sampler
+    assert "TraceIdRatioBased{0.0}" in sampler.get_description()
+    assert requests == []
@@ -0,0 +1,112 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import asyncio
+import importlib.util
+import json
+import time
+from pathlib import Path
+
+import pytest
+from common.vault import TOKEN_RENEWAL_MARGIN, VaultConfig, VaultReader
+
+# The fake Vault server of the charm tests, at the root of the repository.
+_spec = importlib.util.spec_from_file_location(
+    "fake_vault", Path(__file__).parents[2] / "tests" / "fake_vault.py"
+)
+fake_vault = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fake_vault)
+
+LOGIN = ("POST", "/v1/auth/approle/login")
+
+
+@pytest.fixture
+def vault():
+    with fake_vault.FakeVault() as vault:
+        vault.put_secret("secrets", {"token": "t0ken"})
+        vault.put_secret("other", {"password": "passw0rd"})
+        yield vault
+
+
+@pytest.fixture
+def make_reader(vault, tmp_path):
+    approle_path = tmp_path / "approle.json"
+    approle_path.write_text(
+        json.dumps({"role_id": vault.role_id, "role_secret_id": vault.role_secret_id})
+    )
+
+    def make_reader(**kwargs):
+        config = VaultConfig(
+            addr=vault.url, approle_path=str(approle_path), mount=vault.mount, **kwargs
+        )
+        return VaultReader(config)
+
+    return make_reader
+
+
+def read(path):
+    return ("GET", f"/v1/temporal-worker-k8s/data/{path}")
+
+
+async def test_secrets_are_cached(vault, make_reader):
+    reader = make_reader()
+
+    assert await reader.read("secrets", "token") == "t0ken"
+    assert await reader.read("secrets", "token") == "t0ken"
+
+    assert vault.requests == [LOGIN, read("secrets")]
+
+
+async def test_cache_expires_after_its_ttl(vault, make_reader):
+    reader = make_reader(cache_ttl=0.05)
+    assert await reader.read("secrets", "token") == "t0ken"
+    vault.put_secret("secrets", {"token": "r0tated"})
+
+    await asyncio.sleep(0.1)
+
+    assert await reader.read("secrets", "token") == "r0tated"
+    assert vault.requests == [LOGIN, read("secrets"), read("secrets")]
+
+
+async def test_concurrent_reads_are_coalesced(vault, make_reader):
+    reader = make_reader()
+    vault.latency = 0.05
+
+    values = await asyncio.gather(*(reader.read("secrets", "token") for _ in range(5)))
+
+    assert values == ["t0ken"] * 5
+    assert vault.requests == [LOGIN, read("secrets")]
+
+
+async def test_concurrent_reads_share_a_login(vault, make_reader):
+    reader = make_reader()
+    vault.latency = 0.05
+
+    await asyncio.gather(
+        reader.read("secrets", "token"), reader.read("other", "password")
+    )
+
+    assert vault.requests.count(LOGIN) == 1
+
+
+async def test_login_is_renewed_before_expiry(vault, make_reader):
+    reader = make_reader(cache_ttl=0)
+    await reader.read("secrets", "token")
+
+    # The token expires within the renewal margin.
+    reader._token_expires_at = time.monotonic() + TOKEN_RENEWAL_MARGIN - 1
+    await reader.read("secrets", "token")
+
+    assert vault.requests == [LOGIN, read("secrets"), LOGIN, read("secrets")]
+
+
+async def test_read_is_retried_after_forbidden(vault, make_reader):
+    reader = make_reader(cache_ttl=0)
+    await reader.read("secrets", "token")
+    vault.reset_stats()
+
+    # The token is revoked before its expected expiry.
+    vault.fail_next(1, status=403)
+
+    assert await reader.read("secrets", "token") == "t0ken"
+    assert vault.requests == [read("secrets"), LOGIN, read("secrets")]
@@ -6,6 +6,8 @@
 
 """Charm definition and helpers."""
 
+import hashlib
+import json
 import logging
 import os
 import secrets
@@ -15,23 +17,57 @@ from charms.data_platform_libs.v0.data_interfaces import DatabaseRequires
 from charms.grafana_k8s.v0.grafana_dashboard import GrafanaDashboardProvider
 from charms.loki_k8s.v1.loki_push_api import LogForwarder
 from charms.prometheus_k8s.v0.prometheus_scrape import MetricsEndpointProvider
+from charms.tempo_coordinator_k8s.v0.tracing import (
+    ProtocolNotRequestedError,
+    TracingEndpointRequirer,
+)
 from charms.vault_k8s.v0 import vault_kv
 from ops import main, pebble
 from ops.charm import CharmBase
-from ops.model import ActiveStatus, BlockedStatus, MaintenanceStatus, WaitingStatus
+from ops.framework import StoredState
+from ops.model import (
+    ActiveStatus,
+    BlockedStatus,
+    MaintenanceStatus,
+    SecretNotFoundError,
+    WaitingStatus,
+)
 
 import environment_processors
+import metrics
+from juju_secrets import JujuSecretResolver
 from literals import (
     AUTH_SECRET_PARAMETERS,
+    CHARM_ONLY_CONFIG,
+    ENVIRONMENT_FILE_PATH,
+    PAYLOAD_OFFLOAD_PATH,
     PROMETHEUS_PORT,
+    RECONCILED_PEER_DATA,
+    RELOAD_FILE_PATH,
+    RELOADABLE_CONFIG,
     REQUIRED_CANDID_CONFIG,
     REQUIRED_CHARM_CONFIG,
     REQUIRED_OIDC_CONFIG,
+    SECRETS_MANIFEST,
+    SECRETS_PATH,
+    SHARED_ENVIRONMENT_SECRET_LABEL,
     SUPPORTED_AUTH_PROVIDERS,
+    SUPPORTED_CONFIG_RELOADS,
+    SUPPORTED_ENVIRONMENT_DELIVERIES,
+    SUPPORTED_ENVIRONMENT_RESOLUTIONS,
+    SUPPORTED_PAYLOAD_COMPRESSIONS,
+    SUPPORTED_PAYLOAD_OFFLOAD_STORES,
+    SUPPORTED_SECRET_DELIVERIES,
+    TRACING_PROTOCOL,
     VALID_LOG_LEVELS,
 )
 from log import log_event_handler
-from relations.postgresql import Postgresql
+from relations.postgresql import (
+    Postgresql,
+    build_dsn,
+    known_hosts,
+    reconciled_connection,
+)
 from relations.vault import VAULT_NONCE_SECRET_LABEL, VaultRelation
 from state import State
 from vault.actions import VaultActions
@@ -42,6 +78,8 @@ logger = logging.getLogger(__name__)
 class TemporalWorkerK8SOperatorCharm(CharmBase):
     """Charm the service."""
 
+    _stored = StoredState()
+
     def __init__(self, *args):
         """Construct.
 
@@ -51,6 +89,9 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         super().__init__(*args)
         self._state = State(self.app, lambda: self.model.get_relation("peer"))
         self.name = "temporal-worker"
+        self.juju_secrets = JujuSecretResolver(self)
+        # Digests of the peer app data the unit last updated the workload for.
+        self._stored.set_default(reconciled={})
 
         self.database = DatabaseRequires(
             self, relation_name="database", database_name=self.model.config.get("db-name", None)
@@ -63,6 +104,7 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         self.framework.observe(self.on.update_status, self._on_update_status)
         self.framework.observe(self.on.install, self._on_install)
         self.framework.observe(self.on.secret_changed, self._on_secret_changed)
+        self.framework.observe(self.on.peer_relation_changed, self._on_peer_relation_changed)
 
         # Vault
         self.vault = vault_kv.VaultKvRequires(
@@ -74,10 +116,16 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         self.vault_actions = VaultActions(self)
 
         # Prometheus
+        try:
+            scrape_jobs = metrics.scrape_jobs(self.config)
+        except ValueError:
+            # Invalid metrics config is reported through the unit status by `_validate`.
+            scrape_jobs = metrics.scrape_jobs({})
+
         self._prometheus_scraping = MetricsEndpointProvider(
             self,
             relation_name="metrics-endpoint",
-            jobs=[{"static_configs": [{"targets": [f"*:{PROMETHEUS_PORT}"]}]}],
+            jobs=scrape_jobs,
             refresh_event=self.on.config_changed,
         )
 
@@ -87,6 +135,11 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         # Grafana
         self._grafana_dashboards = GrafanaDashboardProvider(self, relation_name="grafana-dashboard")
 
+        # Tracing
+        self.tracing = TracingEndpointRequirer(self, protocols=[TRACING_PROTOCOL])
+        self.framework.observe(self.tracing.on.endpoint_changed, self._on_tracing_endpoint_changed)
+        self.framework.observe(self.tracing.on.endpoint_removed, self._on_tracing_endpoint_changed)
+
     @log_event_handler(logger)
     def _on_install(self, event):
         """Handle on install event.
@@ -147,8 +200,71 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         Args:
             event: The event triggered when the secret changed.
         """
+        # The tracked revision is moved before anything else, so that the rotation is not lost if
+        # the update stops before reading the secret, e.g. on invalid config.
+        self.juju_secrets.refresh(event.secret)
         self._update(event)
 
+    @log_event_handler(logger)
+    def _on_peer_relation_changed(self, event):
+        """Handle changes to the data shared between units.
+
+        Args:
+            event: The event triggered when the peer relation changed.
+        """
+        if not self._state.is_ready():
+            return
+
+        digests = self._peer_data_digests()
+        changed = [key for key, digest in digests.items() if self._stored.reconciled.get(key) != digest]
+        if not changed:
+            return
+
+        logger.info("updating charm to reflect new %s", ", ".join(changed))
+        self._update(event)
+
+    def _peer_data_digests(self):
+        """Digest the peer app data whose changes require updating the workload.
+
+        Only digests are kept in the unit's stored state, so that it holds no database credentials.
+
+        Returns:
+            dict: The SHA-256 of each item of RECONCILED_PEER_DATA.
+        """
+        digests = {}
+        for key in RECONCILED_PEER_DATA:
+            value = getattr(self._state, key)
+            if key == "database_connection":
+                value = reconciled_connection(value)
+            digests[key] = hashlib.sha256(json.dumps(value, sort_keys=True).encode()).hexdigest()
+        return digests
+
+    @log_event_handler(logger)
+    def _on_tracing_endpoint_changed(self, event):
+        """Handle changes of the tracing endpoint, including its removal.
+
+        Args:
+            event: The event triggered when the tracing endpoint changed.
+        """
+        self._update(event)
+
+    def _tracing_endpoint(self):
+        """Get the OTLP endpoint published by the tracing provider.
+
+        Returns:
+            The URL of the OTLP HTTP receiver, or None if it is not available.
+        """
+        if not self.tracing.is_ready():
+            return None
+
+        try:
+            return self.tracing.get_endpoint(TRACING_PROTOCOL)
+        except ProtocolNotRequestedError:
+            # Raised while the receiver is not published yet on units which cannot read the
+            # protocols requested by the leader.
+            logger.debug("tracing relation: no %s receiver published yet", TRACING_PROTOCOL)
+            return None
+
     @log_event_handler(logger)
     def _on_update_status(self, event):
         """Handle `update-status` events.
@@ -162,16 +278,28 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
             self._update(event)
             return
 
+        container = self.unit.get_container(self.name)
         try:
             self._validate(event)
             environment_config = self.config.get("environment")
-            if environment_config:
-                self.create_env()
+            if environment_config and self.config["vault-secret-watch"]:
+                if self._watch_vault_secrets():
+                    self._update(event)
+                    return
+            elif environment_config:
+                revision = self._state.environment_revision
+                resolved = self._resolve_environment()
+                if self._state.environment_revision != revision:
+                    # The leader shared a new environment, which the other units will update to.
+                    self._update(event)
+                    return
+                # Projected secrets are refreshed in place, which picks up rotated Vault secrets.
+                if resolved and self.config["secret-delivery"] == "files" and container.can_connect():
+                    self._project_secrets(container, resolved[1])
         except ValueError as err:
             self.unit.status = BlockedStatus(str(err))
             return
 
-        container = self.unit.get_container(self.name)
         valid_pebble_plan = self._validate_pebble_plan(container)
         if not valid_pebble_plan:
             self._update(event)
@@ -181,6 +309,30 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
             f"worker listening to namespace {self.config['namespace']!r} on queue {self.config['queue']!r}"
         )
 
+    def _watch_vault_secrets(self):
+        """Check the versions of the Vault secrets referenced in the `environment` config.
+
+        Only the leader reads the versions. It records them in the peer relation, which makes the
+        other units reload their environment when a secret changed.
+
+        Returns:
+            bool: Whether a watched secret changed, so that this unit has to reload its environment.
+
+        Raises:
+            ValueError: if the versions could not be read from Vault.
+        """
+        parsed_environment_data = environment_processors.parse_environment(self.config["environment"])
+        paths = [item["path"] for item in parsed_environment_data["vault"]]
+        if not (paths and self.unit.is_leader() and self.model.get_relation("vault")):
+            return False
+
+        try:
+            changed = self.vault_relation.watch_secret_versions(paths)
+        except Exception as e:
+            raise ValueError(f"Unable to read vault secret versions: {e}") from e
+
+        return changed
+
     def _validate_pebble_plan(self, container):
         """Validate Temporal worker pebble plan.
 
@@ -206,8 +358,7 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
             ValueError: if any of the required config is not set.
         """
         auth_config = {}
-        secret = self.model.get_secret(id=self.config.get("auth-secret-id"))
-        secret_content = secret.get_content(refresh=True)
+        secret_content = self.juju_secrets.get_content(self.config.get("auth-secret-id"))
 
         if not secret_content["auth-provider"]:
             raise ValueError("Invalid config: auth-provider value missing from auth-secret")
@@ -241,6 +392,16 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         Returns:
             dict: A dictionary containing environment variables.
         """
+        env_variables, secret_variables = self.resolve_env()
+        return {**env_variables, **secret_variables}
+
+    def resolve_env(self):
+        """Resolve the `environment` config into plain variables and secret values.
+
+        Returns:
+            tuple: A dictionary of the plain environment variables, and a dictionary of the
+                values read from Juju and Vault secrets.
+        """
         self.vault_relation.update_vault_relation()
 
         environment_config = self.config.get("environment")
@@ -250,8 +411,162 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         juju_variables = environment_processors.process_juju_variables(self, parsed_environment_data)
         vault_variables = environment_processors.process_vault_variables(self, parsed_environment_data)
 
-        charm_env = {**env_variables, **juju_variables, **vault_variables}
-        return charm_env
+        return env_variables, {**juju_variables, **vault_variables}
+
+    def _resolve_environment(self):
+        """Resolve the `environment` config, or read it as resolved by the leader.
+
+        With `environment-resolution` set to `leader`, the leader resolves the environment and
+        shares it with the other units through an app-owned Juju secret, whose revision in the
+        peer relation makes them update the workload.
+
+        Returns:
+            tuple: A dictionary of the plain environment variables, and a dictionary of the values
+                read from Juju and Vault secrets, or None if the leader did not share them yet.
+        """
+        if self.config["environment-resolution"] == "unit":
+            if self.unit.is_leader() and self._state.environment_revision is not None:
+                self._remove_shared_environment()
+            return self.resolve_env()
+
+        if self.unit.is_leader():
+            env_variables, secret_variables = self.resolve_env()
+            self._share_environment(env_variables, secret_variables)
+            return env_variables, secret_variables
+
+        if self._state.environment_revision is None:
+            return None
+        try:
+            secret = self.model.get_secret(label=SHARED_ENVIRONMENT_SECRET_LABEL)
+            shared = json.loads(secret.get_content(refresh=True)["environment"])
+        except SecretNotFoundError:
+            return None
+        return shared["env"], shared["secrets"]
+
+    def _share_environment(self, env_variables, secret_variables):
+        """Store the resolved environment in the app-owned secret read by the other units.
+
+        Args:
+            env_variables: The plain environment variables.
+            secret_variables: The values read from Juju and Vault secrets.
+        """
+        content = {
+            "environment": json.dumps({"env": env_variables, "secrets": secret_variables}, sort_keys=True),
+        }
+        try:
+            secret = self.model.get_secret(label=SHARED_ENVIRONMENT_SECRET_LABEL)
+        except SecretNotFoundError:
+            self.app.add_secret(content, label=SHARED_ENVIRONMENT_SECRET_LABEL)
+        else:
+            if secret.peek_content() == content:
+                return
+            secret.set_content(content)
+
+        self._state.environment_revision = (self._state.environment_revision or 0) + 1
+
+    def _remove_shared_environment(self):
+        """Remove the environment shared by the leader, which holds secret values."""
+        try:
+            self.model.get_secret(label=SHARED_ENVIRONMENT_SECRET_LABEL).remove_all_revisions()
+        except SecretNotFoundError:
+            pass
+        del self._state.environment_revision
+
+    def _project_secrets(self, container, secret_env):
+        """Write each secret value to its own file in the workload's secrets directory.
+
+        Only the values which changed since the last projection are written, and the manifest of
+        their hashes is written last, so that the workload sees complete updates. Pebble writes
+        each file to a temporary path and renames it into place, so that readers never see a
+        partially written value.
+
+        Args:
+            container: The workload container.
+            secret_env: The values read from Juju and Vault secrets.
+
+        Raises:
+            ValueError: if a variable name cannot be used as a file name.
+        """
+        for name in secret_env:
+            if not name or "/" in name or name.startswith("."):
+                raise ValueError(f"Invalid environment: secret `{name}` cannot be written to a file")
+
+        values = {name: str(value) for name, value in secret_env.items()}
+        manifest = {name: hashlib.sha256(value.encode()).hexdigest() for name, value in values.items()}
+        manifest_path = f"{SECRETS_PATH}/{SECRETS_MANIFEST}"
+        try:
+            current = json.loads(container.pull(manifest_path).read())
+        except (pebble.PathError, ValueError):
+            current = {}
+        if current == manifest:
+            return
+
+        for name, value in values.items():
+            if current.get(name) != manifest[name]:
+                container.push(f"{SECRETS_PATH}/{name}", value, make_dirs=True, permissions=0o600)
+        for name in current.keys() - manifest.keys():
+            if container.exists(f"{SECRETS_PATH}/{name}"):
+                container.remove_path(f"{SECRETS_PATH}/{name}")
+
+        container.push(manifest_path, json.dumps(manifest, sort_keys=True), make_dirs=True, permissions=0o600)
+
+    def _deliver_environment(self, container, charm_env):
+        """Deliver the variables resolved from the `environment` config to the workload.
+
+        Depending on `environment-delivery`, the variables are either returned to be set in the
+        Pebble service environment, or written to a file in the container whose path is returned.
+
+        Args:
+            container: The workload container.
+            charm_env: The variables resolved from the `environment` config.
+
+        Returns:
+            dict: The environment variables to set in the Pebble service.
+        """
+        delivery = self.config["environment-delivery"]
+        if delivery == "env":
+            # Do not leave secrets behind when switching back from a file.
+            if container.exists(ENVIRONMENT_FILE_PATH):
+                container.remove_path(ENVIRONMENT_FILE_PATH)
+            return charm_env
+
+        values = {key: value if isinstance(value, str) else json.dumps(value) for key, value in charm_env.items()}
+        if delivery == "json":
+            content = json.dumps(values, indent=2, sort_keys=True) + "\n"
+        else:
+            content = "".join(
+                f"{key}={json.dumps(value, ensure_ascii=False)}\n" for key, value in sorted(values.items())
+            )
+
+        # The file holds secrets, so it is only readable by the workload user.
+        container.push(ENVIRONMENT_FILE_PATH, content, make_dirs=True, permissions=0o600)
+        return {
+            "TEMPORAL_ENVIRONMENT_FILE": ENVIRONMENT_FILE_PATH,
+            "TEMPORAL_ENVIRONMENT_FILE_FORMAT": delivery,
+            "TEMPORAL_ENVIRONMENT_FILE_HASH": hashlib.sha256(content.encode()).hexdigest(),
+        }
+
+    def _deliver_reloadable(self, container, reloadable_env):
+        """Write the reloadable variables to the file the workload re-reads on `SIGHUP`.
+
+        Args:
+            container: The workload container.
+            reloadable_env: The variables which can be changed without a restart.
+
+        Returns:
+            bool: Whether the content of the file changed.
+        """
+        values = {key: value if isinstance(value, str) else json.dumps(value) for key, value in reloadable_env.items()}
+        content = json.dumps(values, indent=2, sort_keys=True) + "\n"
+        try:
+            if container.pull(RELOAD_FILE_PATH).read() == content:
+                return False
+        except pebble.PathError:
+            pass
+
+        # Plain variables are not secret, but may be read by the workload user only like the rest.
+        container.push(RELOAD_FILE_PATH, content, make_dirs=True, permissions=0o600)
+        return True
 
     def _check_required_config(self, config_object, config_list):
         """Check if required config has been set by user.
@@ -298,16 +613,73 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         if self.config["sentry-dsn"] and (sample_rate < 0 or sample_rate > 1):
             raise ValueError("Invalid config: sentry-sample-rate must be between 0 and 1")
 
+        tracing_sample_rate = self.config["tracing-sample-rate"]
+        if tracing_sample_rate < 0 or tracing_sample_rate > 1:
+            raise ValueError("Invalid config: tracing-sample-rate must be between 0 and 1")
+
+        metrics.scrape_jobs(self.config)
+
+        if self.config["payload-compression"] not in SUPPORTED_PAYLOAD_COMPRESSIONS:
+            raise ValueError("Invalid config: payload-compression not supported")
+
+        if self.config["payload-compression-threshold"] < 0:
+            raise ValueError("Invalid config: payload-compression-threshold must not be negative")
+
+        self._validate_payload_offload()
+
+        if self.config["environment-delivery"] not in SUPPORTED_ENVIRONMENT_DELIVERIES:
+            raise ValueError("Invalid config: environment-delivery not supported")
+
+        if self.config["secret-delivery"] not in SUPPORTED_SECRET_DELIVERIES:
+            raise ValueError("Invalid config: secret-delivery not supported")
+
+        if self.config["config-reload"] not in SUPPORTED_CONFIG_RELOADS:
+            raise ValueError("Invalid config: config-reload not supported")
+
+        if self.config["environment-resolution"] not in SUPPORTED_ENVIRONMENT_RESOLUTIONS:
+            raise ValueError("Invalid config: environment-resolution not supported")
+
         environment_config = self.config.get("environment")
         if environment_config:
             try:
-                yaml.safe_load(environment_config)
+                environment_processors.load_yaml(environment_config)
             except (yaml.parser.ParserError, yaml.scanner.ScannerError) as e:
                 raise ValueError(f"Incorrectly formatted `environment` config: {e}") from e
 
         if self.model.get_relation("database") and not self.config.get("db-name"):
             raise ValueError("Invalid config: db name value missing")
 
+        for option in ["db-pool-size", "db-pool-idle-timeout", "db-pool-max-lifetime"]:
+            if self.config[option] < 1:
+                raise ValueError(f"Invalid config: {option} must be a positive integer")
+
+    def _validate_payload_offload(self):
+        """Validate the payload offload configuration.
+
+        Raises:
+            ValueError: in case of invalid configuration.
+        """
+        store = self.config["payload-offload-store"]
+        if store not in SUPPORTED_PAYLOAD_OFFLOAD_STORES:
+            raise ValueError("Invalid config: payload-offload-store not supported")
+
+        if self.config["payload-offload-threshold"] < 1:
+            raise ValueError("Invalid config: payload-offload-threshold must be a positive integer")
+
+        if self.config["payload-offload-retention-days"] < 0:
+            raise ValueError("Invalid config: payload-offload-retention-days must not be negative")
+
+        # Filesystem storage is provisioned per unit, so payloads offloaded by one unit could not be
+        # read by the others.
+        if store == "filesystem" and self.app.planned_units() > 1:
+            raise ValueError("Invalid config: payload-offload-store filesystem only supports a single unit")
+
+        if store == "filesystem" and not self.model.storages["payloads"]:
+            raise ValueError("Invalid config: payload-offload-store filesystem requires payloads storage")
+
+        if store == "s3" and not self.config["payload-offload-s3-bucket"]:
+            raise ValueError("Invalid config: payload-offload-s3-bucket value missing")
+
     def _update(self, event):  # noqa: C901
         """Update the Temporal worker configuration and replan its execution.
 
@@ -322,11 +694,30 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
 
         context = {}
         auth_config = {}
+        reloadable = self.config["config-reload"] == "signal"
+        reloaded = False
         try:
             self._validate(event)
-            if self.config.get("environment"):
-                charm_config_env = self.create_env()
-                context.update(charm_config_env)
+            resolved = self._resolve_environment() if self.config.get("environment") else ({}, {})
+            if resolved is None:
+                self.unit.status = WaitingStatus("waiting for leader to resolve environment")
+                return
+            env_variables, secret_variables = resolved
+            if self.config["secret-delivery"] == "files":
+                self._project_secrets(container, secret_variables)
+                secret_variables = {}
+            elif container.exists(SECRETS_PATH):
+                container.remove_path(SECRETS_PATH, recursive=True)
+            if reloadable:
+                reloadable_env = {**env_variables}
+                for key in RELOADABLE_CONFIG:
+                    reloadable_env[convert_env_var(key, prefix="TWC_")] = self.config[key]
+                    reloadable_env[convert_env_var(key, prefix="TEMPORAL_")] = self.config[key]
+                reloaded = self._deliver_reloadable(container, reloadable_env)
+                env_variables = {}
+            elif container.exists(RELOAD_FILE_PATH):
+                container.remove_path(RELOAD_FILE_PATH)
+            context.update(self._deliver_environment(container, {**env_variables, **secret_variables}))
             if self.config.get("auth-secret-id"):
                 auth_config = self.get_auth_config_from_juju_secret()
         except ValueError as err:
@@ -346,21 +737,17 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
             if value:
                 context.update({key: value})
 
-        context.update(
-            {
-                convert_env_var(key, prefix="TWC_"): value
-                for key, value in self.config.items()
-                if key not in ["environment", "auth-secret-id"]
-            }
-        )
+        # Reloadable options are delivered in the reload file instead, so that changing them
+        # leaves the plan unchanged.
+        rendered_config = {
+            key: value
+            for key, value in self.config.items()
+            if key not in CHARM_ONLY_CONFIG and not (reloadable and key in RELOADABLE_CONFIG)
+        }
 
-        context.update(
-            {
-                convert_env_var(key, prefix="TEMPORAL_"): value
-                for key, value in self.config.items()
-                if key not in ["environment", "auth-secret-id"]
-            }
-        )
+        context.update({convert_env_var(key, prefix="TWC_"): value for key, value in rendered_config.items()})
+
+        context.update({convert_env_var(key, prefix="TEMPORAL_"): value for key, value in rendered_config.items()})
 
         # Auth configs coming from a juju secret take precedence over those coming from config.
         # Auth config options will be deprecated in favor of using juju user secrets.
@@ -370,16 +757,37 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
         context.update({"TWC_PROMETHEUS_PORT": PROMETHEUS_PORT, "TEMPORAL_PROMETHEUS_PORT": PROMETHEUS_PORT})
 
         if self.model.get_relation("database"):
+            # Role-dependent values are kept out of the plan: the host is the first of the known
+            # endpoints, and the primary and standbys are selected when connecting instead.
+            hosts = known_hosts(self._state.database_connection)
+            host, _, port = hosts[0].rpartition(":")
             context.update(
                 {
-                    "TEMPORAL_DB_HOST": self._state.database_connection.get("host"),
-                    "TEMPORAL_DB_PORT": self._state.database_connection.get("port"),
+                    "TEMPORAL_DB_HOST": host,
+                    "TEMPORAL_DB_PORT": port,
                     "TEMPORAL_DB_PASSWORD": self._state.database_connection.get("password"),
                     "TEMPORAL_DB_USER": self._state.database_connection.get("user"),
                     "TEMPORAL_DB_TLS": self._state.database_connection.get("tls"),
+                    "TEMPORAL_DB_RO_HOSTS": ",".join(hosts),
+                    "TEMPORAL_DB_DSN": build_dsn(self._state.database_connection, self.config.get("db-name")),
                 }
             )
 
+        context.update(self.vault_relation.configure_workload(container))
+
+        if self.config["payload-offload-store"] == "filesystem":
+            context.update({"TEMPORAL_PAYLOAD_OFFLOAD_PATH": PAYLOAD_OFFLOAD_PATH})
+
+        if self.config["secret-delivery"] == "files":
+            context.update({"TEMPORAL_SECRETS_PATH": SECRETS_PATH})
+
+        if reloadable:
+            context.update({"TEMPORAL_RELOAD_FILE": RELOAD_FILE_PATH})
+
+        tracing_endpoint = self._tracing_endpoint()
+        if tracing_endpoint:
+            context.update({"TEMPORAL_TRACING_ENDPOINT": tracing_endpoint})
+
         pebble_layer = {
             "summary": "temporal worker layer",
             "services": {
@@ -393,8 +801,17 @@ class TemporalWorkerK8SOperatorCharm(CharmBase):
             },
         }
 
+        # Pebble only restarts services whose definition changed, so compare the service as
+        # Pebble normalises it before and after the layer is added.
+        previous_service = container.get_plan().services.get(self.name)
         container.add_layer(self.name, pebble_layer, combine=True)
+        restart_required = previous_service != container.get_plan().services.get(self.name)
         container.replan()
+        self._stored.reconciled = self._peer_data_digests()
+
+        if reloaded and not restart_required and container.get_service(self.name).is_running():
+            logger.info("Signalling Temporal worker to reload its configuration")
+            container.send_signal("SIGHUP", self.name)
 
         self.unit.status = MaintenanceStatus("replanning application")
 
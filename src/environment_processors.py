@@ -3,15 +3,50 @@
 
 """Secret config processors."""
 
+import hashlib
 import json
 import logging
 
 import yaml
 from ops.jujuversion import JujuVersion
 from ops.model import ModelError, SecretNotFoundError
+from pydantic import ValidationError
+
+from environment_schema import Environment, format_errors
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Parsed `environment` config, keyed by the SHA-256 of its content. Only the
+# latest config is kept, which is enough for the several parses of a hook.
+_yaml_cache = {}
+# Validated `environment` config, keyed in the same way.
+_environment_cache = {}
+
+
+def load_yaml(yaml_string):
+    """Parse a YAML string, reusing the result of the previous parse of the same content.
+
+    The libyaml loader is used when PyYAML was built with it. The returned object is shared
+    between callers and must not be modified.
+
+    Args:
+        yaml_string: The YAML string to be parsed.
+
+    Returns:
+        The parsed YAML document.
+    """
+    key = hashlib.sha256(yaml_string.encode()).hexdigest()
+    if key not in _yaml_cache:
+        data = yaml.load(yaml_string, Loader=SafeLoader)
+        _yaml_cache.clear()
+        _yaml_cache[key] = data
+    return _yaml_cache[key]
+
 
 def process_env_variables(parsed_environment_data):
     """Process environment variables from the parsed secrets data.
@@ -61,8 +96,7 @@ def process_juju_variables(charm, parsed_environment_data):
             key_name = juju_secret.get("name")
             from_key = juju_secret.get("key")
 
-            secret = charm.model.get_secret(id=secret_id)
-            secret_content = secret.get_content(refresh=True)
+            secret_content = charm.juju_secrets.get_content(secret_id)
 
             # Only secret-id is provided, read all keys and convert them to env variables
             if not key_name and not from_key:
@@ -95,7 +129,6 @@ def process_vault_variables(charm, parsed_environment_data):
         ValueError: If there is no vault relation, if there is an error initializing the vault client,
                     or if there is an error reading a vault secret.
     """
-    # TODO (kelkawi-a): Convert to using structured config
     charm_env = {}
     vault_variables = parsed_environment_data.get("vault", [])
 
@@ -135,6 +168,10 @@ def parse_environment(yaml_string):
         - 'juju': A list of dictionaries with 'secret-id', 'name', and 'key' keys.
         - 'vault': A list of dictionaries with 'path', 'name', and 'key' keys.
 
+    The whole document is validated in a single pass against the schema in `environment_schema`,
+    and every error is logged with the path of the invalid value. The result is cached by the
+    SHA-256 of the content, and must not be modified.
+
     Args:
         yaml_string: The YAML string to be parsed.
 
@@ -150,45 +187,20 @@ def parse_environment(yaml_string):
     Raises:
         ValueError: If the YAML string does not conform to the expected structure.
     """
-    data = yaml.safe_load(yaml_string)
-
-    # Validate env key
-    env = data.get("env", [])
-    if not isinstance(env, list) or not all(
-        isinstance(item, dict) and "name" in item and "value" in item and len(item) == 2 for item in env
-    ):
-        logging.debug("Invalid environment structure: 'env' should be a list of dictionaries with 'name' and 'value'")
-        raise ValueError("Invalid environment structure. Check logs")
-
-    # Validate juju key
-    juju = data.get("juju", [])
-    if not isinstance(juju, list) or not all(
-        isinstance(item, dict)
-        and ((set(item.keys()) == {"secret-id"}) or (set(item.keys()) == {"secret-id", "name", "key"}))
-        for item in juju
-    ):
-        logging.debug(
-            "Invalid environment structure: each item in 'juju' must either contain only 'secret-id' or all of 'secret-id', 'name', and 'key'"
-        )
-        raise ValueError("Invalid environment structure. Check logs")
-
-    # Validate vault key
-    vault = data.get("vault", [])
-    if not isinstance(vault, list) or not all(
-        isinstance(item, dict) and "path" in item and "name" in item and "key" in item and len(item) == 3
-        for item in vault
-    ):
-        logging.debug(
-            "Invalid environment structure: 'vault' should be a list of dictionaries with 'path', 'name', and 'key'"
-        )
-        raise ValueError("Invalid environment structure. Check logs")
-
-    parsed_data = {
-        "env": [{"name": item.get("name"), "value": item.get("value")} for item in env],
-        "juju": [
-            {"secret-id": item.get("secret-id"), "name": item.get("name"), "key": item.get("key")} for item in juju
-        ],
-        "vault": [{"path": item.get("path"), "name": item.get("name"), "key": item.get("key")} for item in vault],
-    }
-
+    key = hashlib.sha256(yaml_string.encode()).hexdigest()
+    if key in _environment_cache:
+        return _environment_cache[key]
+
+    try:
+        environment = Environment.model_validate(load_yaml(yaml_string))
+    except ValidationError as e:
+        errors = format_errors(e)
+        for error in errors:
+            logger.error("Invalid environment structure: %s", error)
+        more = f" (and {len(errors) - 1} more, check logs)" if len(errors) > 1 else ""
+        raise ValueError(f"Invalid environment structure: {errors[0]}{more}") from e
+
+    parsed_data = environment.model_dump(by_alias=True)
+    _environment_cache.clear()
+    _environment_cache[key] = parsed_data
     return parsed_data
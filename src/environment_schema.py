@@ -0,0 +1,98 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Schema of the `environment` config option."""
+
+from typing import Annotated, Any, List, Optional
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    ValidationError,
+    model_validator,
+)
+from pydantic_core import PydanticCustomError
+
+
+def _scalar_to_str(value):
+    """Convert YAML scalars such as `123` or `true` to strings, as they were accepted before.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The string form of a number or boolean, or the value unchanged.
+    """
+    if isinstance(value, (bool, int, float)):
+        return str(value)
+    return value
+
+
+# Names, keys, paths and secret IDs written unquoted in YAML may be parsed as numbers or booleans.
+ScalarStr = Annotated[str, BeforeValidator(_scalar_to_str)]
+
+
+class _Entry(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
+
+
+class EnvVariable(_Entry):
+    """A plain environment variable."""
+
+    name: ScalarStr
+    value: Any
+
+
+class JujuSecretReference(_Entry):
+    """A Juju secret, or a key of one, exposed as environment variables."""
+
+    secret_id: ScalarStr = Field(alias="secret-id")
+    name: Optional[ScalarStr] = None
+    key: Optional[ScalarStr] = None
+
+    @model_validator(mode="after")
+    def _check_name_and_key(self):
+        if (self.name is None) != (self.key is None):
+            raise PydanticCustomError("name_and_key", "'name' and 'key' must be set together")
+        return self
+
+
+class VaultSecretReference(_Entry):
+    """A key of a Vault secret exposed as an environment variable."""
+
+    path: ScalarStr
+    name: ScalarStr
+    key: ScalarStr
+
+
+class Environment(BaseModel):
+    """The `environment` config option.
+
+    Other top-level keys are ignored, as they have always been.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    env: List[EnvVariable] = []
+    juju: List[JujuSecretReference] = []
+    vault: List[VaultSecretReference] = []
+
+
+def format_errors(error: ValidationError) -> List[str]:
+    """Describe each validation error with the path of the invalid value.
+
+    Args:
+        error: The validation error raised by the schema.
+
+    Returns:
+        list: A message per error, e.g. `env[0].name: Field required`.
+    """
+    messages = []
+    for detail in error.errors(include_url=False):
+        path = ""
+        for part in detail["loc"]:
+            path += f"[{part}]" if isinstance(part, int) else f".{part}"
+        messages.append(f"{path.lstrip('.') or 'environment'}: {detail['msg']}")
+    return messages
@@ -0,0 +1,62 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Resolve the content of the Juju secrets referenced by the charm config."""
+
+
+def secret_key(secret_id):
+    """Return the unique part of a secret ID, whichever form it is given in.
+
+    Args:
+        secret_id: A secret ID or URI, e.g. `secret:<id>` or `secret://<model-uuid>/<id>`.
+
+    Returns:
+        str: The unique ID of the secret.
+    """
+    return secret_id.removeprefix("secret:").rsplit("/", 1)[-1]
+
+
+class JujuSecretResolver:
+    """Fetch the content of Juju secrets at most once per hook.
+
+    The same secret can be referenced by the `auth-secret-id` config and by several `juju` entries
+    of the `environment` config, each of which used to cost a `secret-get` round trip. The content
+    of each distinct secret is now fetched once per hook and shared.
+
+    The revision of a secret is tracked by Juju for the unit, so the content of the tracked
+    revision is read on every hook. On `secret-changed`, the tracking of the changed secret is
+    moved to its latest revision right away, whether or not the hook goes on to read it. Secret
+    content is not persisted by the charm.
+    """
+
+    def __init__(self, charm):
+        """Construct.
+
+        Args:
+            charm: The charm reading the secrets.
+        """
+        self.charm = charm
+        self._content = {}
+
+    def refresh(self, secret):
+        """Track the latest revision of a changed secret, and keep its content for the hook.
+
+        Args:
+            secret: The secret which changed.
+        """
+        self._content[secret_key(secret.id)] = secret.get_content(refresh=True)
+
+    def get_content(self, secret_id):
+        """Return the content of a secret, fetching it on first use in the hook.
+
+        Args:
+            secret_id: The ID of the secret.
+
+        Returns:
+            dict: The content of the secret. It is shared and must not be modified.
+        """
+        key = secret_key(secret_id)
+        if key not in self._content:
+            secret = self.charm.model.get_secret(id=secret_id)
+            self._content[key] = secret.get_content()
+        return self._content[key]
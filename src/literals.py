@@ -22,7 +22,38 @@ REQUIRED_OIDC_CONFIG = [
     "oidc-client-cert-url",
 ]
 SUPPORTED_AUTH_PROVIDERS = ["candid", "google"]
+SUPPORTED_PAYLOAD_COMPRESSIONS = ["none", "zlib", "zstd"]
+SUPPORTED_PAYLOAD_OFFLOAD_STORES = ["none", "filesystem", "s3"]
+PAYLOAD_OFFLOAD_PATH = "/payloads"
+SUPPORTED_ENVIRONMENT_DELIVERIES = ["env", "json", "dotenv"]
+ENVIRONMENT_FILE_PATH = "/etc/temporal-worker/environment"
+SUPPORTED_SECRET_DELIVERIES = ["env", "files"]
+# /dev/shm is an in-memory filesystem, so secret values are never written to disk.
+SECRETS_PATH = "/dev/shm/temporal-worker/secrets"  # nosec
+SECRETS_MANIFEST = ".manifest.json"  # nosec
+SUPPORTED_CONFIG_RELOADS = ["restart", "signal"]
+# Config options whose changes the workload can apply on SIGHUP, without a restart.
+RELOADABLE_CONFIG = ["log-level"]
+RELOAD_FILE_PATH = "/etc/temporal-worker/reload.json"
+SUPPORTED_ENVIRONMENT_RESOLUTIONS = ["unit", "leader"]
+SHARED_ENVIRONMENT_SECRET_LABEL = "resolved-environment"  # nosec
+# Peer app data set by the leader, whose changes make every unit update the workload.
+RECONCILED_PEER_DATA = ["vault_versions", "environment_revision", "database_connection"]
 PROMETHEUS_PORT = 9000
+# The workload exports spans using OTLP over HTTP.
+TRACING_PROTOCOL = "otlp_http"
+# Config options consumed by the charm itself and not rendered into the workload environment.
+CHARM_ONLY_CONFIG = [
+    "environment",
+    "environment-delivery",
+    "secret-delivery",
+    "config-reload",
+    "vault-secret-watch",
+    "environment-resolution",
+    "auth-secret-id",
+    "metrics-drop-labels",
+    "metrics-keep-families",
+]
 AUTH_SECRET_PARAMETERS = [
     "encryption-key",
     "auth-provider",
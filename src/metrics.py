@@ -0,0 +1,158 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Prometheus scrape job helpers."""
+
+import re
+
+from literals import PROMETHEUS_PORT
+
+# Suffixes Prometheus appends to a metric family when exposing counters, histograms and summaries.
+METRIC_FAMILY_SUFFIXES = ["_bucket", "_sum", "_count", "_total"]
+LABEL_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+def _split_list(value):
+    """Split a comma-separated config value into a list of stripped, non-empty items.
+
+    Args:
+        value: comma-separated string.
+
+    Returns:
+        list of items.
+    """
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def parse_drop_labels(value):
+    """Parse the `metrics-drop-labels` config option.
+
+    Each entry is either a label name, in which case the label is dropped, or a label
+    name followed by `:<buckets>`, in which case the label value is replaced by a hash
+    bucket between 0 and `buckets - 1`.
+
+    Args:
+        value: comma-separated list of labels.
+
+    Returns:
+        dict mapping each label to its number of hash buckets, or None if the label is dropped.
+
+    Raises:
+        ValueError: if an entry is not a valid label or bucket count.
+    """
+    labels = {}
+    for entry in _split_list(value):
+        label, _, buckets = entry.partition(":")
+        label = label.strip()
+        if not LABEL_NAME_PATTERN.match(label) or label.startswith("__"):
+            raise ValueError(f"Invalid config: metrics-drop-labels has invalid label {label!r}")
+
+        if not buckets:
+            labels[label] = None
+            continue
+
+        try:
+            bucket_count = int(buckets)
+        except ValueError as e:
+            raise ValueError(f"Invalid config: metrics-drop-labels has invalid bucket count for {label!r}") from e
+
+        if bucket_count < 1:
+            raise ValueError(f"Invalid config: metrics-drop-labels bucket count for {label!r} must be positive")
+        labels[label] = bucket_count
+
+    return labels
+
+
+def parse_keep_families(value):
+    """Parse the `metrics-keep-families` config option.
+
+    Args:
+        value: comma-separated list of metric family names.
+
+    Returns:
+        list of metric family names.
+
+    Raises:
+        ValueError: if an entry is not a valid metric name.
+    """
+    families = _split_list(value)
+    for family in families:
+        if not re.match(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$", family):
+            raise ValueError(f"Invalid config: metrics-keep-families has invalid metric family {family!r}")
+    return families
+
+
+def metric_relabel_configs(drop_labels, keep_families):
+    """Build the `metric_relabel_configs` section of the worker scrape job.
+
+    Args:
+        drop_labels: dict of labels as returned by `parse_drop_labels`.
+        keep_families: list of metric families as returned by `parse_keep_families`.
+
+    Returns:
+        list of Prometheus metric relabel configs.
+    """
+    configs = []
+    if keep_families:
+        suffixes = "|".join(METRIC_FAMILY_SUFFIXES)
+        families = "|".join(re.escape(family) for family in keep_families)
+        configs.append(
+            {
+                "source_labels": ["__name__"],
+                "regex": f"({families})({suffixes})?",
+                "action": "keep",
+            }
+        )
+
+    for label, buckets in drop_labels.items():
+        if buckets is None:
+            configs.append({"regex": label, "action": "labeldrop"})
+            continue
+
+        # Hash into a temporary label first so that series without the label are left untouched, then
+        # drop the temporary label, which hashmod writes onto every series.
+        hash_label = f"__tmp_hash_{label}"
+        configs.extend(
+            [
+                {
+                    "source_labels": [label],
+                    "modulus": buckets,
+                    "target_label": hash_label,
+                    "action": "hashmod",
+                },
+                {
+                    "source_labels": [label, hash_label],
+                    "regex": "(.+);(.+)",
+                    "target_label": label,
+                    "replacement": "$2",
+                    "action": "replace",
+                },
+                {"regex": hash_label, "action": "labeldrop"},
+            ]
+        )
+
+    return configs
+
+
+def scrape_jobs(config):
+    """Build the scrape jobs passed to the metrics endpoint provider.
+
+    Args:
+        config: charm config.
+
+    Returns:
+        list of scrape jobs.
+
+    Raises:
+        ValueError: if the metrics config options are not valid.
+    """
+    job = {"static_configs": [{"targets": [f"*:{PROMETHEUS_PORT}"]}]}
+
+    relabel_configs = metric_relabel_configs(
+        parse_drop_labels(config.get("metrics-drop-labels")),
+        parse_keep_families(config.get("metrics-keep-families")),
+    )
+    if relabel_configs:
+        job["metric_relabel_configs"] = relabel_configs
+
+    return [job]
@@ -4,6 +4,7 @@
 """Define the Temporal worker postgresql relation."""
 
 import logging
+from urllib.parse import quote, urlencode
 
 from ops import framework
 from ops.model import WaitingStatus
@@ -12,6 +13,11 @@ from log import log_event_handler
 
 logger = logging.getLogger(__name__)
 
+# Connection fields whose changes require updating the workload. The workload environment is only
+# rendered from these fields, none of which depends on the current role of each endpoint, so that a
+# failover within the known hosts leaves the plan, and the running worker, unchanged.
+RECONCILED_CONNECTION_FIELDS = ["hosts", "user", "password", "tls"]
+
 
 class Postgresql(framework.Object):
     """Client for postgresql relations."""
@@ -27,6 +33,7 @@ class Postgresql(framework.Object):
 
         charm.framework.observe(charm.database.on.database_created, self._on_database_changed)
         charm.framework.observe(charm.database.on.endpoints_changed, self._on_database_changed)
+        charm.framework.observe(charm.database.on.read_only_endpoints_changed, self._on_database_changed)
         charm.framework.observe(charm.on.database_relation_broken, self._on_database_relation_broken)
 
     @log_event_handler(logger)
@@ -43,10 +50,11 @@ class Postgresql(framework.Object):
             event.defer()
             return
 
-        self.charm.unit.status = WaitingStatus(f"handling {event.relation.name} change")
-
-        self.update_db_relation_data_in_state(event)
-        self.charm._update(event)
+        # The workload is only replanned on changes of the fields in RECONCILED_CONNECTION_FIELDS.
+        # The other units are updated through the peer relation.
+        if self.update_db_relation_data_in_state(event):
+            self.charm.unit.status = WaitingStatus(f"handling {event.relation.name} change")
+            self.charm._update(event)
 
     @log_event_handler(logger)
     def _on_database_relation_broken(self, event) -> None:
@@ -97,23 +105,75 @@ class Postgresql(framework.Object):
         if len(primary_endpoint) < 2:
             return False
 
+        read_only_endpoints = relation_data.get("read-only-endpoints", "").split(",")
+
         db_conn = {
             "host": primary_endpoint[0],
             "port": primary_endpoint[1],
             "password": relation_data.get("password"),
             "user": relation_data.get("username"),
             "tls": relation_data.get("tls"),
+            "read_only_hosts": [endpoint.strip() for endpoint in read_only_endpoints if endpoint.strip()],
+            # Every known endpoint, in a stable order, as candidates for the multi-host connection string.
+            "hosts": sorted({endpoint.strip() for endpoint in endpoints + read_only_endpoints if endpoint.strip()}),
         }
 
         if None in (db_conn["user"], db_conn["password"]):
             return False
 
-        should_update = False
-        fields_to_check = ["host", "user", "password", "tls"]
-        database_connection = self.charm._state.database_connection or {}
-        if any(database_connection.get(field, "") != db_conn[field] for field in fields_to_check):
-            should_update = True
-
+        should_update = reconciled_connection(self.charm._state.database_connection) != reconciled_connection(db_conn)
         self.charm._state.database_connection = db_conn
 
         return should_update
+
+
+def reconciled_connection(database_connection) -> dict:
+    """Select the connection fields whose changes require updating the workload.
+
+    Empty values are treated alike so that fields missing from older state do not trigger an update.
+
+    Args:
+        database_connection: database connection info stored in the peer relation, or None.
+
+    Returns:
+        dict: The value of each field in RECONCILED_CONNECTION_FIELDS.
+    """
+    database_connection = database_connection or {}
+    return {field: database_connection.get(field) or None for field in RECONCILED_CONNECTION_FIELDS}
+
+
+def known_hosts(database_connection) -> list:
+    """List every known endpoint of the database, in a stable order.
+
+    Args:
+        database_connection: database connection info stored in the peer relation.
+
+    Returns:
+        The `host:port` endpoints, falling back to the primary endpoint for state stored by older revisions.
+    """
+    return database_connection.get("hosts") or [f"{database_connection.get('host')}:{database_connection.get('port')}"]
+
+
+def build_dsn(database_connection, database_name) -> str:
+    """Build a libpq multi-host connection URI for the database.
+
+    All known endpoints are listed as hosts, and `target_session_attrs=read-write` makes libpq
+    connect to whichever of them is currently the primary. This lets the workload follow a
+    failover without the charm having to re-render its environment.
+
+    Args:
+        database_connection: database connection info stored in the peer relation.
+        database_name: name of the database.
+
+    Returns:
+        The connection URI.
+    """
+    hosts = known_hosts(database_connection)
+    user = quote(database_connection.get("user") or "", safe="")
+    password = quote(database_connection.get("password") or "", safe="")
+
+    params = {"target_session_attrs": "read-write"}
+    if str(database_connection.get("tls")).lower() == "true":
+        params["sslmode"] = "require"
+
+    return f"postgresql://{user}:{password}@{','.join(hosts)}/{quote(database_name or '', safe='')}?{urlencode(params)}"
@@ -3,6 +3,7 @@
 
 """Define the Vault relation."""
 
+import json
 import logging
 from pathlib import Path
 from typing import Optional
@@ -18,6 +19,8 @@ logger = logging.getLogger(__name__)
 
 VAULT_NONCE_SECRET_LABEL = "nonce"  # nosec
 VAULT_CERT_PATH = "/vault/cert.pem"
+# /dev/shm is an in-memory filesystem, so the AppRole credentials are never written to disk.
+VAULT_APPROLE_PATH = "/dev/shm/temporal-worker/vault/approle.json"  # nosec
 VAULT_CA_CERT_FILENAME = "ca.pem"
 
 
@@ -32,6 +35,7 @@ class VaultRelation(framework.Object):
         """
         super().__init__(charm, "vault")
         self.charm = charm
+        self._vault_client = None
 
         charm.framework.observe(charm.vault.on.connected, self._on_vault_connected)
         charm.framework.observe(charm.vault.on.ready, self._on_vault_ready)
@@ -131,21 +135,120 @@ class VaultRelation(framework.Object):
             "vault_mount": mount,
         }
 
+    def watch_secret_versions(self, paths):
+        """Record the current version of the watched Vault secrets in the peer relation.
+
+        Only the KV v2 metadata of each secret is read. Must be called by the leader.
+
+        Args:
+            paths: The paths of the Vault secrets to watch.
+
+        Returns:
+            bool: Whether a secret changed since the versions were last recorded. Secrets which
+                were not watched before are not reported as changed.
+        """
+        vault_client = self.get_vault_client()
+        versions = {path: vault_client.read_secret_version(path) for path in sorted(set(paths))}
+
+        previous = self.charm._state.vault_versions or {}
+        if versions == previous:
+            return False
+
+        self.charm._state.vault_versions = versions
+        changed = [path for path, version in versions.items() if previous.get(path) not in (None, version)]
+        if changed:
+            logger.info("vault secrets changed: %s", ", ".join(changed))
+        return bool(changed)
+
+    def configure_workload(self, container):
+        """Provide the workload with the Vault connection details.
+
+        These allow the workload to read secrets from Vault at runtime, so that rotated
+        secrets are picked up without restarting it. The CA certificate and the AppRole
+        credentials are written to files in the container, the latter readable by its owner
+        only, so that the credentials are not exposed in the Pebble plan.
+
+        Args:
+            container: The workload container.
+
+        Returns:
+            A dictionary of environment variables, empty if the Vault relation is not ready.
+        """
+        connection = self._get_workload_connection()
+        if not connection:
+            if container.exists(VAULT_APPROLE_PATH):
+                container.remove_path(VAULT_APPROLE_PATH)
+            return {}
+
+        container.push(VAULT_CERT_PATH, connection["ca_certificate"], make_dirs=True)
+        container.push(
+            VAULT_APPROLE_PATH,
+            json.dumps({"role_id": connection["role_id"], "role_secret_id": connection["role_secret_id"]}),
+            make_dirs=True,
+            permissions=0o600,
+        )
+        return {
+            "TEMPORAL_VAULT_ADDR": connection["address"],
+            "TEMPORAL_VAULT_MOUNT": connection["mount"],
+            "TEMPORAL_VAULT_CERT_PATH": VAULT_CERT_PATH,
+            "TEMPORAL_VAULT_APPROLE_PATH": VAULT_APPROLE_PATH,
+        }
+
+    def _get_workload_connection(self):
+        """Retrieve the Vault connection details of the unit.
+
+        Returns:
+            A dictionary of connection details, empty if the Vault relation is not ready.
+        """
+        relation = self.charm.model.get_relation("vault")
+        if relation is None:
+            return {}
+
+        vault_url = self.charm.vault.get_vault_url(relation)
+        ca_certificate = self.charm.vault.get_ca_certificate(relation)
+        mount = self.charm.vault.get_mount(relation)
+        unit_credentials = self.charm.vault.get_unit_credentials(relation)
+        if not all([vault_url, ca_certificate, mount, unit_credentials]):
+            logger.debug("vault relation: connection details not available yet")
+            return {}
+
+        try:
+            secret = self.charm.model.get_secret(id=unit_credentials)
+            secret_content = secret.get_content(refresh=True)
+        except ModelError as e:
+            logger.warning(f"vault relation: failed to read unit credentials - {repr(e)}")
+            return {}
+
+        return {
+            "address": vault_url,
+            "ca_certificate": ca_certificate,
+            "mount": mount,
+            "role_id": secret_content["role-id"],
+            "role_secret_id": secret_content["role-secret-id"],
+        }
+
     def get_vault_client(self):
         """Initialize Vault client.
 
+        The client is kept for the rest of the hook, so that a hook handling the environment more
+        than once logs in to Vault and reads each secret only once.
+
         Returns:
             Vault client.
         """
+        if self._vault_client is not None:
+            return self._vault_client
+
         ca_certificate_path = self.get_ca_cert_location_in_charm()
         vault_config = self.get_vault_config()
-        return VaultClient(
+        self._vault_client = VaultClient(
             address=vault_config["vault_address"],
             role_id=vault_config["vault_role_id"],
             role_secret_id=vault_config["vault_role_secret_id"],
             mount_point=vault_config["vault_mount"],
             cert_path=f"{ca_certificate_path}/{VAULT_CA_CERT_FILENAME}",
         )
+        return self._vault_client
 
     def get_ca_cert_location_in_charm(self) -> Optional[Path]:
         """Return the CA certificate location in the charm (not in the workload).
@@ -6,9 +6,23 @@
 import logging
 
 import hvac
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Transient Vault errors, e.g. while a standby is promoted or Vault is sealed, are retried with
+# exponential backoff. Reads are retried on error responses, and every request is retried when the
+# connection could not be established.
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "LIST"}),
+    raise_on_status=False,
+)
+
 
 class VaultOperationError(Exception):
     """Exception raised for errors in the vault operations."""
@@ -18,6 +32,8 @@ class VaultClient:
     """A client to interact with HashiCorp Vault.
 
     This client handles authentication using AppRole and provides methods to read and write secrets.
+    Requests share a single HTTP session, so that the connection to Vault is reused, and each path
+    is read at most once, so that several keys of the same secret cost a single round trip.
 
     Attributes:
         client (hvac.Client): An instance of the hvac Client.
@@ -33,11 +49,17 @@ class VaultClient:
             role_secret_id: The AppRole Secret ID for authentication.
             mount_point: The mount point for the secret engine.
         """
+        session = requests.Session()
+        # hvac ignores `verify` when given a session, so the CA certificate is set on the session itself.
+        session.verify = cert_path
+        session.mount("http://", HTTPAdapter(max_retries=RETRY))
+        session.mount("https://", HTTPAdapter(max_retries=RETRY))
         self.client = hvac.Client(
             url=address,
-            verify=cert_path,
+            session=session,
         )
         self.mount_point = mount_point
+        self._secrets = {}
         self._authenticate(role_id, role_secret_id)
 
     def _authenticate(self, role_id: str, role_secret_id: str):
@@ -56,10 +78,11 @@ class VaultClient:
             use_token=False,
         )
 
-        self.client.token = login_response["auth"]["client_token"]
-
-        if not self.client.is_authenticated():
+        # A failed login raises, so a token in the response needs no further round trip to check it.
+        token = (login_response.get("auth") or {}).get("client_token")
+        if not token:
             raise Exception("Vault authentication failed.")
+        self.client.token = token
 
     def read_secret(self, path: str, key: str):
         """Read a secret from Vault at the given path and returns the value for the specified key.
@@ -75,8 +98,31 @@ class VaultClient:
             Exception: If the operation fails.
         """
         try:
-            secret = self.client.secrets.kv.v2.read_secret(path=path, mount_point=self.mount_point)
-            return secret["data"]["data"][key]
+            if path not in self._secrets:
+                secret = self.client.secrets.kv.v2.read_secret(path=path, mount_point=self.mount_point)
+                self._secrets[path] = secret["data"]["data"]
+            return self._secrets[path][key]
+        except Exception as e:
+            raise Exception(f"Could not fetch from Vault: {e}") from e
+
+    def read_secret_version(self, path: str) -> int:
+        """Read the current version of a secret from its KV v2 metadata.
+
+        The metadata is much smaller than the secret data, and is not cached, so that it can be
+        polled to detect changes.
+
+        Args:
+            path: The path to the secret in Vault.
+
+        Returns:
+            int: The current version of the secret.
+
+        Raises:
+            Exception: If the operation fails.
+        """
+        try:
+            metadata = self.client.secrets.kv.v2.read_secret_metadata(path=path, mount_point=self.mount_point)
+            return metadata["data"]["current_version"]
         except Exception as e:
             raise Exception(f"Could not fetch from Vault: {e}") from e
 
@@ -94,6 +140,7 @@ class VaultClient:
         Raises:
             VaultOperationError: If the operation fails.
         """
+        self._secrets.pop(path, None)
         try:
             self.client.secrets.kv.v2.patch(path=path, secret={key: value}, mount_point=self.mount_point)
             return
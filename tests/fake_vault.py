@@ -0,0 +1,229 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Local fake Vault HTTP server for deterministic Vault client tests."""
+
+import json
+import re
+import secrets
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+KV_DATA_PATH = re.compile(r"^/v1/(?P<mount>[^/]+)/data/(?P<path>.+)$")
+KV_METADATA_PATH = re.compile(r"^/v1/(?P<mount>[^/]+)/metadata/(?P<path>.+)$")
+TOKEN_TTL = 3600
+
+
+class FakeVault:
+    """Serve the subset of the Vault API used by the charm.
+
+    Supports AppRole login, token lookup and renewal, KV v2 reads and writes, and KV v2 metadata
+    reads.
+    Every request is recorded, together with the client port it came from, so
+    that tests can count round trips and check that connections are reused.
+
+    Attributes:
+        url: base URL of the server.
+        role_id: AppRole role ID accepted on login.
+        role_secret_id: AppRole secret ID accepted on login.
+        mount: KV v2 mount point.
+        secrets: mapping of path to the versions of the secret, latest last.
+        requests: list of `(method, path)` of the requests received.
+        client_ports: list of the client ports of the requests received.
+        latency: seconds to wait before answering each request.
+    """
+
+    def __init__(self, role_id="role-id", role_secret_id="role-secret-id", mount="temporal-worker-k8s"):
+        """Construct.
+
+        Args:
+            role_id: AppRole role ID accepted on login.
+            role_secret_id: AppRole secret ID accepted on login.
+            mount: KV v2 mount point.
+        """
+        self.role_id = role_id
+        self.role_secret_id = role_secret_id
+        self.mount = mount
+        self.secrets = {}
+        self.requests = []
+        self.client_ports = []
+        self.latency = 0.0
+        self._tokens = {}
+        self._errors = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL of the server.
+
+        Returns:
+            the URL.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        """Start serving in a background thread.
+
+        Returns:
+            the fake Vault.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop serving.
+
+        Args:
+            exc_info: exception raised in the context, if any.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def put_secret(self, path, data):
+        """Store a new version of a secret.
+
+        Args:
+            path: path of the secret.
+            data: key-value pairs of the secret.
+        """
+        self.secrets.setdefault(path, []).append(dict(data))
+
+    def fail_next(self, count, status=503):
+        """Answer the next requests with an error.
+
+        Args:
+            count: number of requests to fail.
+            status: HTTP status to answer with.
+        """
+        with self._lock:
+            self._errors.extend([status] * count)
+
+    def reset_stats(self):
+        """Forget the requests received so far."""
+        with self._lock:
+            self.requests.clear()
+            self.client_ports.clear()
+
+    def handle(self, method, path, headers, body, client_port):
+        """Answer a request.
+
+        Args:
+            method: HTTP method.
+            path: request path.
+            headers: request headers.
+            body: decoded JSON body, or None.
+            client_port: port the request came from.
+
+        Returns:
+            tuple of HTTP status and JSON response, or None for an empty response.
+        """
+        with self._lock:
+            self.requests.append((method, path))
+            self.client_ports.append(client_port)
+            error = self._errors.pop(0) if self._errors else None
+
+        if self.latency:
+            time.sleep(self.latency)
+        if error:
+            return error, {"errors": ["injected error"]}
+
+        if method == "POST" and path == "/v1/auth/approle/login":
+            return self._login(body or {})
+
+        token = self._tokens.get(headers.get("X-Vault-Token"))
+        if token is None or token < time.monotonic():
+            return 403, {"errors": ["permission denied"]}
+
+        if path == "/v1/auth/token/lookup-self" and method == "GET":
+            return 200, {"data": {"ttl": int(token - time.monotonic())}}
+        if path == "/v1/auth/token/renew-self" and method in ("POST", "PUT"):
+            self._tokens[headers["X-Vault-Token"]] = time.monotonic() + TOKEN_TTL
+            return 200, {"auth": {"client_token": headers["X-Vault-Token"], "lease_duration": TOKEN_TTL}}
+
+        return self._kv(method, path.split("?")[0], body)
+
+    def _kv(self, method, path, body):
+        match = KV_METADATA_PATH.match(path)
+        if match and match["mount"] == self.mount and method == "GET":
+            return self._read_metadata(match["path"])
+
+        match = KV_DATA_PATH.match(path)
+        if not match or match["mount"] != self.mount:
+            return 404, {"errors": []}
+        if method == "GET":
+            return self._read(match["path"])
+        if method in ("POST", "PUT"):
+            return self._write(match["path"], body or {})
+        return 405, {"errors": []}
+
+    def _login(self, body):
+        if body.get("role_id") != self.role_id or body.get("secret_id") != self.role_secret_id:
+            return 400, {"errors": ["invalid role or secret ID"]}
+        token = secrets.token_hex(8)
+        self._tokens[token] = time.monotonic() + TOKEN_TTL
+        return 200, {"auth": {"client_token": token, "lease_duration": TOKEN_TTL, "renewable": True}}
+
+    def _read(self, path):
+        versions = self.secrets.get(path)
+        if not versions:
+            return 404, {"errors": []}
+        return 200, {
+            "data": {"data": versions[-1], "metadata": {"version": len(versions)}},
+            "lease_duration": 0,
+        }
+
+    def _read_metadata(self, path):
+        versions = self.secrets.get(path)
+        if not versions:
+            return 404, {"errors": []}
+        return 200, {
+            "data": {
+                "current_version": len(versions),
+                "versions": {str(version): {"destroyed": False} for version in range(1, len(versions) + 1)},
+            }
+        }
+
+    def _write(self, path, body):
+        versions = self.secrets.setdefault(path, [])
+        cas = body.get("options", {}).get("cas")
+        if cas is not None and cas != len(versions):
+            return 400, {"errors": ["check-and-set parameter did not match the current version"]}
+        versions.append(body.get("data", {}))
+        return 200, {"data": {"version": len(versions)}}
+
+
+def _handler(vault):
+    class Handler(BaseHTTPRequestHandler):
+        # Keep connections open, so that clients can reuse them.
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # Headers and body are written separately, which Nagle's algorithm would delay.
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def _dispatch(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+            status, response = vault.handle(self.command, self.path, self.headers, body, self.client_address[1])
+            payload = json.dumps(response).encode() if response is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+        def log_message(self, format, *args):  # noqa: A002
+            pass
+
+    return Handler
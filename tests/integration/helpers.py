@@ -6,8 +6,10 @@
 
 import asyncio
 import logging
+import math
 import os
 import time
+import uuid
 from datetime import timedelta
 from pathlib import Path
 from textwrap import dedent
@@ -173,6 +175,52 @@ async def run_sample_workflow(ops_test: OpsTest, workflow_type=None, use_env_var
     assert result == "hello world"
 
 
+async def run_workflow_load(ops_test: OpsTest, count: int, concurrency: int):
+    """Run sample workflows with a fixed number in flight and measure their throughput.
+
+    Args:
+        ops_test: PyTest object.
+        count: Number of workflows to run.
+        concurrency: Number of workflows kept in flight at any time.
+
+    Returns:
+        A dictionary with the number of workflows, the completed workflows per second and the
+        95th percentile of the workflow latency in seconds.
+    """
+    url = await get_application_url(ops_test, application=APP_NAME_SERVER, port=7233)
+    client = await Client.connect(
+        Options(host=url, queue=BASE_WORKER_CONFIG["queue"], namespace=BASE_WORKER_CONFIG["namespace"])
+    )
+
+    run_id = uuid.uuid4().hex[:8]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def run_workflow(index):
+        async with semaphore:
+            start = time.perf_counter()
+            result = await client.execute_workflow(
+                "GreetingWorkflow",
+                "placeholder",
+                id=f"load-{run_id}-{index}",
+                task_queue=BASE_WORKER_CONFIG["queue"],
+                run_timeout=timedelta(seconds=60),
+            )
+            latencies.append(time.perf_counter() - start)
+            assert result == "hello world"
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_workflow(index) for index in range(count)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "workflows": count,
+        "throughput": count / elapsed,
+        "p95_latency": latencies[math.ceil(0.95 * count) - 1],
+    }
+
+
 async def create_default_namespace(ops_test: OpsTest):
     """Create default namespace on Temporal server using tctl.
 
@@ -2,28 +2,76 @@
 # Copyright 2023 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-"""Temporal worker charm scaling integration tests."""
+"""Temporal worker charm scaling integration tests.
 
+The throughput of the sample worker is measured at each unit count, and compared
+with the throughput of a single unit. Scaling efficiency is the throughput at N
+units divided by N times the throughput at one unit. Results are written to
+`SCALING_RESULTS` and reported at the end of the module. A unit count fails if
+its efficiency is below `SCALING_EFFICIENCY_THRESHOLD`, which defaults to a
+conservative 0.5 as efficiency depends on the machine running the test. The load
+can be tuned with `SCALING_WORKFLOWS` and `SCALING_CONCURRENCY`.
+"""
+
+import json
 import logging
+import os
+from pathlib import Path
 
 import pytest
 from conftest import deploy  # noqa: F401, pylint: disable=W0611
-from helpers import APP_NAME, run_sample_workflow, scale
+from helpers import APP_NAME, run_sample_workflow, run_workflow_load, scale
 from pytest_operator.plugin import OpsTest
 
 logger = logging.getLogger(__name__)
 
+UNIT_COUNTS = (1, 2, 4, 8)
+WORKFLOWS = int(os.environ.get("SCALING_WORKFLOWS", "500"))
+# Enough workflows in flight to saturate the largest deployment.
+CONCURRENCY = int(os.environ.get("SCALING_CONCURRENCY", "200"))
+WARMUP_WORKFLOWS = 20
+EFFICIENCY_THRESHOLD = float(os.environ.get("SCALING_EFFICIENCY_THRESHOLD", "0.5"))
+RESULTS_PATH = Path(os.environ.get("SCALING_RESULTS", "scaling-results.json"))
+
+
+@pytest.fixture(scope="module", name="scaling_results")
+def scaling_results_fixture():
+    """Collect the results of each unit count, and report them once all were measured."""
+    results = {}
+    yield results
+    for units, result in results.items():
+        logger.info(
+            "%d units: %.1f workflows/s, p95 latency %.3fs, scaling efficiency %.2f",
+            units,
+            result["throughput"],
+            result["p95_latency"],
+            result["efficiency"],
+        )
+
 
 @pytest.mark.abort_on_fail
 @pytest.mark.usefixtures("deploy")
 class TestScaling:
     """Integration tests for Temporal charm."""
 
-    async def test_scaling_up(self, ops_test: OpsTest):
-        """Scale Temporal worker charm up to 2 units."""
-        await scale(ops_test, app=APP_NAME, units=2)
+    @pytest.mark.parametrize("units", UNIT_COUNTS)
+    async def test_throughput_scaling(self, ops_test: OpsTest, scaling_results, units):
+        """Scale Temporal worker charm up and measure how throughput scales with it."""
+        await scale(ops_test, app=APP_NAME, units=units)
 
-        await run_sample_workflow(ops_test)
+        # Let the new units start polling before measuring.
+        await run_workflow_load(ops_test, WARMUP_WORKFLOWS, WARMUP_WORKFLOWS)
+        result = await run_workflow_load(ops_test, WORKFLOWS, CONCURRENCY)
+
+        single_unit = scaling_results.get(1, result)
+        result["efficiency"] = result["throughput"] / (units * single_unit["throughput"])
+        scaling_results[units] = result
+        # Written after each unit count, so that results are kept if a later one fails.
+        RESULTS_PATH.write_text(json.dumps(scaling_results, indent=2) + "\n")
+
+        assert (
+            result["efficiency"] >= EFFICIENCY_THRESHOLD
+        ), f"scaling efficiency at {units} units is {result['efficiency']:.2f}, below {EFFICIENCY_THRESHOLD}"
 
     async def test_scaling_down(self, ops_test: OpsTest):
         """Scale Temporal charm down to 1 unit."""
@@ -0,0 +1,73 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Result recording and baseline comparison for the hook benchmarks.
+
+Results are written to the JSON file in `BENCHMARK_RESULTS` (default
+`benchmark-results.json`) and compared with `baseline.json`. Each case fails if
+its latency or peak memory exceeds the baseline by more than
+`BENCHMARK_TOLERANCE` (default 1.0, i.e. twice the baseline) plus an absolute
+noise floor, which leaves room for differences between machines and for the
+jitter of the smallest cases. Set `BENCHMARK_UPDATE_BASELINE=1` to record
+the results as the new baseline.
+"""
+
+import json
+import os
+import pathlib
+
+import pytest
+
+BASELINE_PATH = pathlib.Path(__file__).parent / "baseline.json"
+# Absolute increase of each metric which is not considered a regression, however small the baseline.
+NOISE_FLOORS = {"latency_seconds": 0.005, "peak_memory_bytes": 1024 * 1024}
+
+
+class BenchmarkResults:
+    """Benchmark results of the session, keyed by case name."""
+
+    def __init__(self):
+        """Construct."""
+        self.results = {}
+        self.baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+        self.tolerance = float(os.environ.get("BENCHMARK_TOLERANCE", "1.0"))
+        self.update_baseline = os.environ.get("BENCHMARK_UPDATE_BASELINE") == "1"
+
+    def record(self, case, result):
+        """Record the result of a case and compare it with the baseline.
+
+        Args:
+            case: name of the case.
+            result: dict of metric name to measured value.
+        """
+        self.results[case] = result
+        baseline = self.baseline.get(case)
+        if self.update_baseline or not baseline:
+            return
+
+        regressions = [
+            f"{metric}: {value:.6g} > {baseline[metric]:.6g}"
+            for metric, value in result.items()
+            if metric in baseline and value > baseline[metric] * (1 + self.tolerance) + NOISE_FLOORS.get(metric, 0)
+        ]
+        assert not regressions, f"{case} regressed against the baseline ({', '.join(regressions)})"
+
+    def write(self):
+        """Write the results, and the baseline if requested."""
+        path = pathlib.Path(os.environ.get("BENCHMARK_RESULTS", "benchmark-results.json"))
+        report = {
+            case: {**result, "baseline": self.baseline.get(case)} for case, result in sorted(self.results.items())
+        }
+        path.write_text(json.dumps(report, indent=2) + "\n")
+
+        if self.update_baseline:
+            # Cases which were not run, e.g. deselected with -k, keep their previous baseline.
+            baseline = {**self.baseline, **self.results}
+            BASELINE_PATH.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    results = BenchmarkResults()
+    yield results
+    results.write()
@@ -0,0 +1,91 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Parse time of the `environment` config with each YAML loader.
+
+Entries hold nested values, as environments rendering JSON configuration do.
+The PyYAML loader written in Python is compared with the libyaml loader, and
+with a repeated parse of the same content, which is served from the cache.
+The validation of the parsed config against the schema is measured separately.
+"""
+
+import time
+
+import pytest
+import yaml
+
+import environment_processors
+
+ROUNDS = 10
+SIZES = [10, 100, 1000]
+
+
+def build_environment(size):
+    """Build an `environment` config of nested values.
+
+    Args:
+        size: number of environment variables.
+
+    Returns:
+        the `environment` config.
+    """
+    value = {
+        "connection_id": "my_connection_id",
+        "unnesting": {"tables": {f"table{i}": [f"col{j}" for j in range(5)] for i in range(5)}},
+        "redaction": None,
+    }
+    return yaml.safe_dump({"env": [{"name": f"key{i}", "value": [value]} for i in range(size)]})
+
+
+def python_loader(environment):
+    return yaml.load(environment, Loader=yaml.SafeLoader)
+
+
+def libyaml_loader(environment):
+    environment_processors._yaml_cache.clear()
+    return environment_processors.load_yaml(environment)
+
+
+def cached_loader(environment):
+    return environment_processors.load_yaml(environment)
+
+
+LOADERS = {"python": python_loader, "libyaml": libyaml_loader, "cached": cached_loader}
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_environment_parse(benchmark_results, size):
+    environment = build_environment(size)
+    expected = python_loader(environment)
+
+    latencies = {}
+    for name, loader in LOADERS.items():
+        assert loader(environment) == expected
+        timings = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            loader(environment)
+            timings.append(time.perf_counter() - start)
+        latencies[name] = min(timings)
+        benchmark_results.record(f"parse-{name}[{size}]", {"latency_seconds": latencies[name]})
+
+    if environment_processors.SafeLoader is yaml.CSafeLoader:
+        assert latencies["libyaml"] < latencies["python"]
+    assert latencies["cached"] < latencies["libyaml"]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_environment_validate(benchmark_results, size):
+    environment = build_environment(size)
+    environment_processors.load_yaml(environment)
+
+    timings = []
+    for _ in range(ROUNDS):
+        # The parse is cached, so that only the validation is measured.
+        environment_processors._environment_cache.clear()
+        start = time.perf_counter()
+        parsed = environment_processors.parse_environment(environment)
+        timings.append(time.perf_counter() - start)
+    benchmark_results.record(f"validate[{size}]", {"latency_seconds": min(timings)})
+
+    assert len(parsed["env"]) == size
@@ -0,0 +1,166 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Latency and memory of the charm's hooks as the environment grows.
+
+The `environment` config option is scaled along one dimension at a time: plain
+environment variables, Juju secrets, and Vault keys served by a local fake Vault
+server through the charm's Vault client.
+"""
+
+import time
+import tracemalloc
+
+import ops
+import ops.testing
+import pytest
+import yaml
+
+import environment_processors
+
+ROUNDS = 10
+VAULT_PATH = "benchmark"
+
+SIZES = {
+    "env": [10, 100, 1000, 10000],
+    "juju": [1, 10, 50, 200],
+    "vault": [1, 10, 100, 500],
+}
+CASES = [(dimension, size) for dimension, sizes in SIZES.items() for size in sizes]
+HOOKS = ["config-changed", "update-status", "secret-changed"]
+# Name of the environment variable rendered for the last entry of each dimension.
+EXPECTED_KEYS = {"env": "key{}", "juju": "secret{}", "vault": "vault{}"}
+
+
+def build_environment(dimension, size):
+    """Build the `environment` config, the Juju secrets and the Vault secrets for a case.
+
+    Args:
+        dimension: one of `env`, `juju` or `vault`.
+        size: number of entries.
+
+    Returns:
+        tuple of the `environment` config, the list of Juju secrets and the Vault secrets.
+    """
+    environment = {"env": [{"name": "always", "value": "present"}]}
+    secrets = []
+    vault_secrets = {VAULT_PATH: {}}
+
+    if dimension == "env":
+        environment["env"] = [{"name": f"key{i}", "value": f"value{i}"} for i in range(size)]
+    elif dimension == "juju":
+        secrets = [ops.testing.Secret(owner="app", tracked_content={"key": f"value{i}"}) for i in range(size)]
+        environment["juju"] = [
+            {"secret-id": secret.id, "name": f"secret{i}", "key": "key"} for i, secret in enumerate(secrets)
+        ]
+    elif dimension == "vault":
+        vault_secrets[VAULT_PATH] = {f"key{i}": f"value{i}" for i in range(size)}
+        environment["vault"] = [{"path": VAULT_PATH, "name": f"vault{i}", "key": f"key{i}"} for i in range(size)]
+
+    return yaml.safe_dump(environment), secrets, vault_secrets
+
+
+def run_hook(context, hook, state, secret):
+    """Run a hook.
+
+    Args:
+        context: scenario context.
+        hook: name of the hook.
+        state: input state.
+        secret: secret for `secret-changed`.
+
+    Returns:
+        output state.
+    """
+    # Each hook runs in a new process in a deployment, so nothing is cached from the previous one.
+    environment_processors._yaml_cache.clear()
+    environment_processors._environment_cache.clear()
+
+    if hook == "config-changed":
+        event = context.on.config_changed()
+    elif hook == "update-status":
+        event = context.on.update_status()
+    else:
+        event = context.on.secret_changed(secret)
+    return context.run(event, state)
+
+
+def peak_memory(context, hook, state, secret):
+    """Measure the peak memory allocated while running a hook.
+
+    Args:
+        context: scenario context.
+        hook: name of the hook.
+        state: input state.
+        secret: secret for `secret-changed`.
+
+    Returns:
+        peak traced memory, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        run_hook(context, hook, state, secret)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+@pytest.mark.parametrize("hook", HOOKS)
+@pytest.mark.parametrize("dimension,size", CASES)
+def test_hook_latency(
+    context,
+    fake_vault,
+    temporal_worker_container,
+    peer_relation,
+    vault_relation,
+    database_relation,
+    config,
+    token_secret,
+    vault_nonce_secret,
+    benchmark_results,
+    hook,
+    dimension,
+    size,
+):
+    # `secret-changed` is emitted for a user secret granted to the charm.
+    changed_secret = ops.testing.Secret(tracked_content={"key": "value"}, latest_content={"key": "rotated"})
+
+    def planned_state(size):
+        environment, secrets, vault_secrets = build_environment(dimension, size)
+        for path, data in vault_secrets.items():
+            fake_vault.put_secret(path, data)
+
+        state = ops.testing.State(
+            leader=True,
+            config={**config, "environment": environment},
+            containers=[temporal_worker_container],
+            relations=[peer_relation, vault_relation, database_relation],
+            secrets=[token_secret, vault_nonce_secret, changed_secret, *secrets],
+        )
+        # Start from a planned workload, as `update-status` otherwise replans.
+        state = context.run(context.on.config_changed(), state)
+        assert isinstance(state.unit_status, ops.MaintenanceStatus), state.unit_status
+        return state
+
+    # The same hook with an empty environment gives the memory used by the test harness and the
+    # charm regardless of the environment, which is subtracted from the peak of each case.
+    empty_state = planned_state(0)
+    state = planned_state(size)
+    environment_out = state.get_container("temporal-worker").plan.services["temporal-worker"].environment
+    assert environment_out[EXPECTED_KEYS[dimension].format(size - 1)]
+
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        run_hook(context, hook, state, changed_secret)
+        timings.append(time.perf_counter() - start)
+
+    empty_peak = peak_memory(context, hook, empty_state, changed_secret)
+    peak = peak_memory(context, hook, state, changed_secret)
+
+    # The fastest round is the least disturbed by the rest of the machine.
+    benchmark_results.record(
+        f"{hook}[{dimension}-{size}]",
+        {"latency_seconds": min(timings), "peak_memory_bytes": max(peak - empty_peak, 0)},
+    )
@@ -2,11 +2,14 @@
 # See LICENSE file for licensing details.
 
 import json
+import unittest.mock
 
+import ops.jujuversion
 import ops.testing
 import pytest
 
 from charm import TemporalWorkerK8SOperatorCharm
+from tests.fake_vault import FakeVault
 
 
 def pytest_configure(config):  # noqa: DCO020
@@ -84,6 +87,8 @@ def peer_relation(request):
                 "password": "inner-light",
                 "user": "jean-luc",
                 "tls": "True",
+                "read_only_hosts": [],
+                "hosts": ["anotherhost:2345", "myhost:5432"],
             }
         )
 
@@ -215,3 +220,20 @@ def database_relation():
             "tls": "True",
         },
     )
+
+
+@pytest.fixture(scope="function")
+def fake_vault():
+    """A fake Vault server, used as the Vault of the vault relation."""
+    with FakeVault() as vault, unittest.mock.patch(
+        "ops.jujuversion.JujuVersion.from_environ", return_value=ops.jujuversion.JujuVersion(version="3.6")
+    ), unittest.mock.patch(
+        "relations.vault.VaultRelation.get_vault_config",
+        return_value={
+            "vault_address": vault.url,
+            "vault_role_id": vault.role_id,
+            "vault_role_secret_id": vault.role_secret_id,
+            "vault_mount": vault.mount,
+        },
+    ):
+        yield vault
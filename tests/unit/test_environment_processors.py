@@ -0,0 +1,100 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Environment processors unit tests."""
+
+from unittest import TestCase
+
+import environment_processors
+
+
+class TestLoadYaml(TestCase):
+    """Unit tests for parsing the `environment` config."""
+
+    def setUp(self):
+        """Start from an empty cache."""
+        environment_processors._yaml_cache.clear()
+
+    def test_same_content_is_parsed_once(self):
+        """Parsing the same content again returns the cached document."""
+        first = environment_processors.load_yaml("env:\n  - name: a\n    value: b\n")
+        second = environment_processors.load_yaml("env:\n  - name: a\n    value: b\n")
+        self.assertIs(first, second)
+
+    def test_changed_content_is_parsed(self):
+        """Parsing changed content replaces the cached document."""
+        environment_processors.load_yaml("env: []\n")
+        data = environment_processors.load_yaml("juju: []\n")
+        self.assertEqual(data, {"juju": []})
+        self.assertEqual(len(environment_processors._yaml_cache), 1)
+
+
+class TestParseEnvironment(TestCase):
+    """Unit tests for validating the `environment` config."""
+
+    def setUp(self):
+        """Start from empty caches."""
+        environment_processors._yaml_cache.clear()
+        environment_processors._environment_cache.clear()
+
+    def test_valid_environment(self):
+        """Entries are returned with every field, unset ones as None."""
+        parsed = environment_processors.parse_environment(
+            "env:\n  - name: a\n    value: [1]\njuju:\n  - secret-id: s\nvault:\n  - {path: p, name: n, key: k}\n"
+        )
+        self.assertEqual(
+            parsed,
+            {
+                "env": [{"name": "a", "value": [1]}],
+                "juju": [{"secret-id": "s", "name": None, "key": None}],
+                "vault": [{"path": "p", "name": "n", "key": "k"}],
+            },
+        )
+
+    def test_previously_accepted_environment(self):
+        """YAML numbers and booleans are converted to strings."""
+        parsed = environment_processors.parse_environment(
+            "env:\n  - {name: 1, value: 2}\njuju:\n  - secret-id: 3\n"
+            "vault:\n  - {path: 2024, name: true, key: 1.5}\n"
+        )
+        self.assertEqual(
+            parsed,
+            {
+                "env": [{"name": "1", "value": 2}],
+                "juju": [{"secret-id": "3", "name": None, "key": None}],
+                "vault": [{"path": "2024", "name": "True", "key": "1.5"}],
+            },
+        )
+
+    def test_unknown_entry_key_is_rejected(self):
+        """Unknown keys within an entry are rejected, unlike unknown top-level keys."""
+        with self.assertRaises(ValueError) as raised:
+            environment_processors.parse_environment("env:\n  - {name: a, value: b, comment: c}\nother: x\n")
+        self.assertIn("env[0].comment", str(raised.exception))
+
+    def test_every_error_is_reported(self):
+        """All errors are logged with their path, and the first one is raised."""
+        with self.assertLogs("environment_processors", level="ERROR") as logs:
+            with self.assertRaises(ValueError) as raised:
+                environment_processors.parse_environment(
+                    "env:\n  - name: a\n  - value: b\njuju:\n  - secret-id: s\n    name: n\n"
+                )
+
+        self.assertEqual(
+            str(raised.exception),
+            "Invalid environment structure: env[0].value: Field required (and 2 more, check logs)",
+        )
+        self.assertEqual(
+            [record.getMessage() for record in logs.records],
+            [
+                "Invalid environment structure: env[0].value: Field required",
+                "Invalid environment structure: env[1].name: Field required",
+                "Invalid environment structure: juju[0]: 'name' and 'key' must be set together",
+            ],
+        )
+
+    def test_same_content_is_validated_once(self):
+        """Validating the same content again returns the cached result."""
+        first = environment_processors.parse_environment("env: []\n")
+        second = environment_processors.parse_environment("env: []\n")
+        self.assertIs(first, second)
@@ -0,0 +1,131 @@
+# Copyright 2026 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Vault client unit tests against a local fake Vault."""
+
+from unittest import TestCase
+
+from tests.fake_vault import FakeVault
+from vault.client import VaultClient
+
+LOGIN = ("POST", "/v1/auth/approle/login")
+
+
+class TestVaultClient(TestCase):
+    """Unit tests for the Vault client.
+
+    Attrs:
+        vault: fake Vault server.
+    """
+
+    def setUp(self):
+        """Start the fake Vault."""
+        self.vault = FakeVault()
+        self.vault.__enter__()
+        self.addCleanup(self.vault.__exit__, None, None, None)
+        self.vault.put_secret("secrets", {"key1": "value1", "key2": "value2", "key3": "value3"})
+
+    def make_client(self, cert_path=None):
+        """Create a client logged in to the fake Vault.
+
+        Args:
+            cert_path: path to the CA certificate.
+
+        Returns:
+            the Vault client.
+        """
+        return VaultClient(
+            address=self.vault.url,
+            cert_path=cert_path,
+            role_id=self.vault.role_id,
+            role_secret_id=self.vault.role_secret_id,
+            mount_point=self.vault.mount,
+        )
+
+    def test_ca_certificate_is_used_by_the_session(self):
+        """The CA certificate is used to verify the connections of the shared session."""
+        cert_path = "/usr/local/share/ca-certificates/vault-ca.crt"
+
+        client = self.make_client(cert_path=cert_path)
+
+        self.assertEqual(client.client.adapter.session.verify, cert_path)
+
+    def test_keys_of_a_path_are_read_once(self):
+        """Reading several keys of a secret costs a single round trip after login."""
+        client = self.make_client()
+
+        values = [client.read_secret(path="secrets", key=key) for key in ("key1", "key2", "key3")]
+
+        self.assertEqual(values, ["value1", "value2", "value3"])
+        self.assertEqual(self.vault.requests, [LOGIN, ("GET", "/v1/temporal-worker-k8s/data/secrets")])
+
+    def test_read_secret_version(self):
+        """The current version is read from the metadata, without reading the data."""
+        client = self.make_client()
+        self.assertEqual(client.read_secret_version(path="secrets"), 1)
+
+        self.vault.put_secret("secrets", {"key1": "rotated"})
+
+        self.assertEqual(client.read_secret_version(path="secrets"), 2)
+        self.assertNotIn(("GET", "/v1/temporal-worker-k8s/data/secrets"), self.vault.requests)
+
+    def test_connection_is_reused(self):
+        """All requests of a client go through a single connection."""
+        self.vault.put_secret("other", {"key": "value"})
+        client = self.make_client()
+
+        client.read_secret(path="secrets", key="key1")
+        client.read_secret(path="other", key="key")
+
+        self.assertEqual(len(self.vault.requests), 3)
+        self.assertEqual(len(set(self.vault.client_ports)), 1)
+
+    def test_transient_errors_are_retried(self):
+        """Reads failing with transient errors are retried."""
+        client = self.make_client()
+        self.vault.reset_stats()
+        self.vault.fail_next(2, status=503)
+
+        self.assertEqual(client.read_secret(path="secrets", key="key1"), "value1")
+        self.assertEqual(len(self.vault.requests), 3)
+
+    def test_persistent_errors_are_raised(self):
+        """Reads are retried a bounded number of times."""
+        client = self.make_client()
+        self.vault.reset_stats()
+        self.vault.fail_next(10, status=503)
+
+        with self.assertRaisesRegex(Exception, "Could not fetch from Vault"):
+            client.read_secret(path="secrets", key="key1")
+        self.assertEqual(len(self.vault.requests), 4)
+
+    def test_invalid_credentials(self):
+        """Logging in with invalid credentials fails."""
+        with self.assertRaises(Exception):
+            VaultClient(
+                address=self.vault.url,
+                cert_path=None,
+                role_id=self.vault.role_id,
+                role_secret_id="wrong",
+                mount_point=self.vault.mount,
+            )
+
+    def test_write_secret(self):
+        """Writes patch existing secrets, create new ones and are visible to later reads."""
+        client = self.make_client()
+        client.read_secret(path="secrets", key="key1")
+
+        client.write_secret(path="secrets", key="key1", value="updated")
+        client.write_secret(path="new", key="key", value="created")
+
+        self.assertEqual(client.read_secret(path="secrets", key="key1"), "updated")
+        self.assertEqual(client.read_secret(path="secrets", key="key2"), "value2")
+        self.assertEqual(client.read_secret(path="new", key="key"), "created")
+
+    def test_token_renewal(self):
+        """The client token can be renewed."""
+        client = self.make_client()
+
+        response = client.client.auth.token.renew_self()
+
+        self.assertEqual(response["auth"]["client_token"], client.client.token)